@@ -4,20 +4,54 @@ Automated buy-low/sell-high within a price range
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+# Run as a script (python grid_strategy.py) only advanced/ is on sys.path; imported
+# as advanced.grid_strategy from main.py the src modules are already importable
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from binance.exceptions import BinanceAPIException
 from base_bot import BasicBot
 from logger import logger
 from validator import Validator, ValidationError
-from colorama import Fore, Style, init
+from colors import Fore, Style, RULE
 
-# Initialize colorama
-init(autoreset=True)
+# Orders in flight at once while setting up a grid. This bounds concurrency
+# only; Binance's 50-orders-per-10s limit is enforced by the client's
+# RateLimiter, which delays orders beyond it whatever the worker count.
+GRID_MAX_WORKERS = 10
 
 class GridBot(BasicBot):
     """Bot for executing grid trading strategy"""
     
+    @staticmethod
+    def _grid_payload(symbol, side, price, quantity):
+        """Build the order parameters for one grid level"""
+        return {
+            'symbol': symbol,
+            'side': side,
+            'type': 'LIMIT',
+            'quantity': quantity,
+            'price': price,
+            'timeInForce': 'GTC'
+        }
+    
+    def _place_grid_order(self, payload):
+        """
+        Place a single grid limit order
+        
+        Errors are returned rather than raised so one rejected level, or a
+        network error on it, does not abort the rest of the grid.
+        
+        Returns:
+            Tuple of (success, order dict or the exception raised)
+        """
+        try:
+            return True, self.client.futures_create_order(**payload)
+        except Exception as e:
+            return False, e
+    
     def setup_grid_orders(self, symbol, lower_price, upper_price, num_grids, quantity_per_grid):
         """
         Setup grid trading orders within a price range
@@ -48,17 +82,19 @@ class GridBot(BasicBot):
             
             # Get current price
             current_price = self.get_current_price(symbol)
-            logger.info(f"Current price: {current_price}")
+            logger.info("Current price: %s", current_price)
             
             if current_price < lower_price or current_price > upper_price:
-                logger.warning(f"Current price {current_price} is outside grid range [{lower_price}, {upper_price}]")
+                logger.warning("Current price %s is outside grid range [%s, %s]", current_price, lower_price, upper_price)
             
-            # Calculate grid levels
-            price_step = (upper_price - lower_price) / (num_grids - 1)
-            grid_levels = [lower_price + (i * price_step) for i in range(num_grids)]
+            # Calculate grid levels, scaling each index across the full range
+            # so the last level lands exactly on upper_price
+            price_range = upper_price - lower_price
+            price_step = price_range / (num_grids - 1)
+            grid_levels = [lower_price + price_range * i / (num_grids - 1) for i in range(num_grids)]
             
-            logger.info(f"Setting up grid: {num_grids} levels from {lower_price} to {upper_price}")
-            logger.info(f"Price step: {price_step}")
+            logger.info("Setting up grid: %s levels from %s to %s", num_grids, lower_price, upper_price)
+            logger.info("Price step: %s", price_step)
             
             print(f"\n{Fore.CYAN}Grid Configuration:{Style.RESET_ALL}")
             print(f"  Symbol: {symbol}")
@@ -71,55 +107,64 @@ class GridBot(BasicBot):
             buy_orders = []
             sell_orders = []
             
-            # Place buy orders below current price
-            print(f"{Fore.GREEN}Placing BUY orders below current price...{Style.RESET_ALL}")
-            for level in grid_levels:
-                if level < current_price:
-                    try:
-                        order = self.client.futures_create_order(
-                            symbol=symbol,
-                            side='BUY',
-                            type='LIMIT',
-                            quantity=quantity_per_grid,
-                            price=level,
-                            timeInForce='GTC'
-                        )
-                        buy_orders.append(order)
-                        logger.info(f"BUY order placed at {level}")
-                        print(f"  {Fore.GREEN}✓{Style.RESET_ALL} BUY @ {level} - Order ID: {order['orderId']}")
-                    except BinanceAPIException as e:
-                        logger.error(f"Failed to place BUY order at {level}: {e.message}")
-                        print(f"  {Fore.RED}✗{Style.RESET_ALL} BUY @ {level} - Error: {e.message}")
-            
-            # Place sell orders above current price
-            print(f"\n{Fore.YELLOW}Placing SELL orders above current price...{Style.RESET_ALL}")
-            for level in grid_levels:
-                if level > current_price:
-                    try:
-                        order = self.client.futures_create_order(
-                            symbol=symbol,
-                            side='SELL',
-                            type='LIMIT',
-                            quantity=quantity_per_grid,
-                            price=level,
-                            timeInForce='GTC'
-                        )
-                        sell_orders.append(order)
-                        logger.info(f"SELL order placed at {level}")
-                        print(f"  {Fore.YELLOW}✓{Style.RESET_ALL} SELL @ {level} - Order ID: {order['orderId']}")
-                    except BinanceAPIException as e:
-                        logger.error(f"Failed to place SELL order at {level}: {e.message}")
-                        print(f"  {Fore.RED}✗{Style.RESET_ALL} SELL @ {level} - Error: {e.message}")
+            # Levels are ascending, so the BUY/SELL split is a binary search;
+            # a level exactly at the current price gets no order
+            buy_levels = grid_levels[:bisect_left(grid_levels, current_price)]
+            sell_levels = grid_levels[bisect_right(grid_levels, current_price):]
+            
+            payloads = (
+                [self._grid_payload(symbol, 'BUY', level, quantity_per_grid) for level in buy_levels] +
+                [self._grid_payload(symbol, 'SELL', level, quantity_per_grid) for level in sell_levels]
+            )
+            
+            # Submit every level concurrently; each order is an independent
+            # REST call, so wall time is bounded by the slowest one rather
+            # than the sum of all round-trips
+            with ThreadPoolExecutor(max_workers=GRID_MAX_WORKERS) as executor:
+                results = list(executor.map(self._place_grid_order, payloads))
+            
+            buy_results = results[:len(buy_levels)]
+            sell_results = results[len(buy_levels):]
+            
+            # Report buy orders below current price
+            buy_lines = [f"{Fore.GREEN}BUY orders below current price:{Style.RESET_ALL}"]
+            for level, (ok, result) in zip(buy_levels, buy_results):
+                if ok:
+                    buy_orders.append(result)
+                    logger.debug("BUY order placed at %s", level)
+                    buy_lines.append(f"  {Fore.GREEN}✓{Style.RESET_ALL} BUY @ {level} - Order ID: {result['orderId']}")
+                else:
+                    logger.error("Failed to place BUY order at %s: %s", level, getattr(result, 'message', result))
+                    buy_lines.append(f"  {Fore.RED}✗{Style.RESET_ALL} BUY @ {level} - Error: {getattr(result, 'message', result)}")
+            sys.stdout.write('\n'.join(buy_lines) + '\n')
+            
+            # Report sell orders above current price
+            sell_lines = [f"\n{Fore.YELLOW}SELL orders above current price:{Style.RESET_ALL}"]
+            for level, (ok, result) in zip(sell_levels, sell_results):
+                if ok:
+                    sell_orders.append(result)
+                    logger.debug("SELL order placed at %s", level)
+                    sell_lines.append(f"  {Fore.YELLOW}✓{Style.RESET_ALL} SELL @ {level} - Order ID: {result['orderId']}")
+                else:
+                    logger.error("Failed to place SELL order at %s: %s", level, getattr(result, 'message', result))
+                    sell_lines.append(f"  {Fore.RED}✗{Style.RESET_ALL} SELL @ {level} - Error: {getattr(result, 'message', result)}")
+            sys.stdout.write('\n'.join(sell_lines) + '\n')
+            sys.stdout.flush()
             
             # Summary
-            print(f"\n{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
+            print(f"\n{Fore.GREEN}{RULE}{Style.RESET_ALL}")
             print(f"{Fore.GREEN}Grid Setup Complete{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
+            print(f"{Fore.GREEN}{RULE}{Style.RESET_ALL}")
             print(f"{Fore.CYAN}BUY Orders Placed:{Style.RESET_ALL} {len(buy_orders)}")
             print(f"{Fore.CYAN}SELL Orders Placed:{Style.RESET_ALL} {len(sell_orders)}")
             print(f"{Fore.CYAN}Total Orders:{Style.RESET_ALL} {len(buy_orders) + len(sell_orders)}")
             
-            logger.info(f"Grid setup complete: {len(buy_orders)} BUY, {len(sell_orders)} SELL orders")
+            logger.info(
+                "Grid %s: %d BUYs placed at %s; %d SELLs at %s",
+                symbol,
+                len(buy_orders), [float(o['price']) for o in buy_orders],
+                len(sell_orders), [float(o['price']) for o in sell_orders]
+            )
             
             return {
                 'buy_orders': buy_orders,
@@ -128,7 +173,7 @@ class GridBot(BasicBot):
             }
             
         except ValidationError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             print(f"\n{Fore.RED}✗ Validation Error:{Style.RESET_ALL} {e}")
             raise
         except Exception as e:
@@ -136,30 +181,86 @@ class GridBot(BasicBot):
             print(f"\n{Fore.RED}✗ Error:{Style.RESET_ALL} {str(e)}")
             raise
 
+    def cancel_grid(self, symbol):
+        """
+        Cancel every open order for a symbol in a single request
+        
+        Uses the cancel-all endpoint so tearing down a grid costs one API
+        call instead of one DELETE per grid level.
+        
+        Args:
+            symbol: Trading pair (e.g., BTCUSDT)
+            
+        Returns:
+            Cancellation response
+        """
+        try:
+            symbol = Validator.validate_symbol(symbol)
+            
+            logger.log_api_call("allOpenOrders", {"symbol": symbol})
+            response = self.client.futures_cancel_all_open_orders(symbol=symbol)
+            
+            logger.info("All open orders cancelled for %s", symbol)
+            logger.log_api_response(response)
+            
+            print(f"\n{Fore.GREEN}✓ Grid orders cancelled for {symbol}{Style.RESET_ALL}")
+            
+            return response
+            
+        except ValidationError as e:
+            logger.error("Validation error: %s", e)
+            print(f"\n{Fore.RED}✗ Validation Error:{Style.RESET_ALL} {e}")
+            raise
+        except Exception as e:
+            logger.log_error_trace(e, "Error cancelling grid")
+            print(f"\n{Fore.RED}✗ Error:{Style.RESET_ALL} {str(e)}")
+            raise
+
 def main():
     """CLI entry point for grid trading"""
-    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}{RULE}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Binance Futures - Grid Trading Bot{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+    print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
+    
+    # Tear down an existing grid
+    if len(sys.argv) == 3 and sys.argv[2] == '--cancel':
+        try:
+            bot = GridBot(testnet=True)
+            bot.cancel_grid(sys.argv[1])
+        except KeyboardInterrupt:
+            print(f"\n\n{Fore.YELLOW}Operation cancelled{Style.RESET_ALL}")
+            sys.exit(0)
+        except Exception:
+            sys.exit(1)
+        return
     
     if len(sys.argv) < 6:
         print(f"{Fore.RED}Usage:{Style.RESET_ALL} python grid_strategy.py <SYMBOL> <LOWER_PRICE> <UPPER_PRICE> <NUM_GRIDS> <QTY_PER_GRID>")
+        print(f"       python grid_strategy.py <SYMBOL> --cancel")
         print(f"\n{Fore.CYAN}Examples:{Style.RESET_ALL}")
         print(f"  python grid_strategy.py BTCUSDT 48000 52000 10 0.001")
         print(f"  python grid_strategy.py ETHUSDT 2800 3200 5 0.01")
+        print(f"  python grid_strategy.py BTCUSDT --cancel")
         print(f"\n{Fore.CYAN}Arguments:{Style.RESET_ALL}")
         print(f"  SYMBOL        - Trading pair")
         print(f"  LOWER_PRICE   - Lower bound of grid")
         print(f"  UPPER_PRICE   - Upper bound of grid")
         print(f"  NUM_GRIDS     - Number of grid levels (2-50)")
         print(f"  QTY_PER_GRID  - Quantity for each grid order")
+        print(f"  --cancel      - Cancel all open orders for SYMBOL")
         sys.exit(1)
     
     symbol = sys.argv[1]
-    lower_price = sys.argv[2]
-    upper_price = sys.argv[3]
-    num_grids = sys.argv[4]
-    quantity_per_grid = sys.argv[5]
+    
+    # Parse numeric arguments before connecting so typos fail immediately
+    try:
+        lower_price = float(sys.argv[2])
+        upper_price = float(sys.argv[3])
+        num_grids = int(sys.argv[4])
+        quantity_per_grid = float(sys.argv[5])
+    except ValueError as e:
+        print(f"{Fore.RED}Invalid argument:{Style.RESET_ALL} {e}")
+        sys.exit(1)
     
     try:
         bot = GridBot(testnet=True)
@@ -167,8 +268,8 @@ def main():
         print(f"{Fore.GREEN}Account Balance:{Style.RESET_ALL} {balance['total_balance']} USDT\n")
         
         result = bot.setup_grid_orders(
-            symbol, float(lower_price), float(upper_price),
-            int(num_grids), float(quantity_per_grid)
+            symbol, lower_price, upper_price,
+            num_grids, quantity_per_grid
         )
         
         print(f"\n{Fore.YELLOW}Grid is now active and will trade automatically!{Style.RESET_ALL}\n")
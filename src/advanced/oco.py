@@ -4,21 +4,33 @@ Places take-profit and stop-loss orders simultaneously
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Run as a script (python oco.py) only advanced/ is on sys.path; imported
+# as advanced.oco from main.py the src modules are already importable
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from binance.exceptions import BinanceAPIException
 from base_bot import BasicBot
 from logger import logger
 from validator import Validator, ValidationError
-from colorama import Fore, Style, init
+from colors import Fore, Style, RULE
+
+class OCOError(Exception):
+    """Raised when only one OCO leg was placed; the message names both outcomes"""
+    pass
 
-# Initialize colorama
-init(autoreset=True)
+def _leg_result(future):
+    """Wait for an OCO leg and return (order, None) or (None, exception)"""
+    try:
+        return future.result(), None
+    except Exception as e:
+        return None, e
 
 class OCOBot(BasicBot):
     """Bot for executing OCO (One-Cancels-the-Other) orders"""
     
-    def place_oco_order(self, symbol, side, quantity, take_profit_price, stop_loss_price):
+    def place_oco_order(self, symbol, side, quantity, take_profit_price, stop_loss_price, current_price=None):
         """
         Place an OCO order (simulated with two separate orders)
         
@@ -31,6 +43,7 @@ class OCOBot(BasicBot):
             quantity: Order quantity
             take_profit_price: Take profit limit price
             stop_loss_price: Stop loss trigger price
+            current_price: Known market price (optional, fetched if not provided)
             
         Returns:
             Dict with both order responses
@@ -43,9 +56,10 @@ class OCOBot(BasicBot):
             take_profit_price = Validator.validate_price(take_profit_price)
             stop_loss_price = Validator.validate_price(stop_loss_price)
             
-            # Get current price for reference
-            current_price = self.get_current_price(symbol)
-            logger.info(f"Current market price: {current_price}")
+            # Get current price for reference unless the caller already has it
+            if current_price is None:
+                current_price = self.get_current_price(symbol)
+            logger.info("Current market price: %s", current_price)
             
             # Validate price logic
             if side == 'SELL':
@@ -60,19 +74,19 @@ class OCOBot(BasicBot):
             
             logger.log_order('OCO', symbol, side, quantity, take_profit_price)
             
-            # Place Take Profit Order
-            tp_order = self.client.futures_create_order(
+            # Place Take Profit and Stop Loss orders together; the two legs
+            # are independent, so neither has to wait on the other's round-trip
+            executor = self.get_executor()
+            tp_future = executor.submit(
+                self.client.futures_create_order,
                 symbol=symbol,
                 side=side,
                 type='TAKE_PROFIT_MARKET',
                 quantity=quantity,
                 stopPrice=take_profit_price
             )
-            
-            logger.info(f"Take profit order placed: {tp_order['orderId']}")
-            
-            # Place Stop Loss Order
-            sl_order = self.client.futures_create_order(
+            sl_future = executor.submit(
+                self.client.futures_create_order,
                 symbol=symbol,
                 side=side,
                 type='STOP_MARKET',
@@ -80,7 +94,19 @@ class OCOBot(BasicBot):
                 stopPrice=stop_loss_price
             )
             
-            logger.info(f"Stop loss order placed: {sl_order['orderId']}")
+            # Wait for both legs before acting on either, so a leg that went
+            # live is never left behind when the other one failed
+            tp_order, tp_error = _leg_result(tp_future)
+            sl_order, sl_error = _leg_result(sl_future)
+            
+            if tp_error is not None and sl_error is not None:
+                logger.error("Stop loss order failed: %s", sl_error)
+                raise tp_error
+            if tp_error is not None or sl_error is not None:
+                self._cancel_surviving_leg(symbol, tp_order, tp_error, sl_order, sl_error)
+            
+            logger.info("Take profit order placed: %s", tp_order['orderId'])
+            logger.info("Stop loss order placed: %s", sl_order['orderId'])
             
             print(f"\n{Fore.GREEN}✓ OCO Orders Placed Successfully!{Style.RESET_ALL}")
             print(f"\n{Fore.CYAN}Take Profit Order:{Style.RESET_ALL}")
@@ -97,7 +123,7 @@ class OCOBot(BasicBot):
             }
             
         except ValidationError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             print(f"\n{Fore.RED}✗ Validation Error:{Style.RESET_ALL} {e}")
             raise
         except Exception as e:
@@ -105,11 +131,28 @@ class OCOBot(BasicBot):
             print(f"\n{Fore.RED}✗ Error:{Style.RESET_ALL} {str(e)}")
             raise
 
+    def _cancel_surviving_leg(self, symbol, tp_order, tp_error, sl_order, sl_error):
+        """Cancel the one OCO leg that was placed and raise OCOError"""
+        if tp_error is not None:
+            placed_name, placed, failed_name, failed = 'stop loss', sl_order, 'take profit', tp_error
+        else:
+            placed_name, placed, failed_name, failed = 'take profit', tp_order, 'stop loss', sl_error
+        order_id = placed['orderId']
+        
+        try:
+            self.cancel_order(symbol, order_id)
+            outcome = f"{placed_name} order {order_id} was placed and has been cancelled"
+        except Exception as e:
+            logger.critical("%s order %s is still open on %s: %s", placed_name, order_id, symbol, e)
+            outcome = f"{placed_name} order {order_id} was placed and could NOT be cancelled ({e})"
+        
+        raise OCOError(f"OCO {failed_name} order failed ({failed}); {outcome}") from failed
+
 def main():
     """CLI entry point for OCO orders"""
-    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}{RULE}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Binance Futures - OCO Order Bot{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+    print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
     
     if len(sys.argv) < 6:
         print(f"{Fore.RED}Usage:{Style.RESET_ALL} python oco.py <SYMBOL> <SIDE> <QUANTITY> <TAKE_PROFIT> <STOP_LOSS>")
@@ -118,9 +161,15 @@ def main():
     
     symbol = sys.argv[1]
     side = sys.argv[2]
-    quantity = sys.argv[3]
-    take_profit_price = sys.argv[4]
-    stop_loss_price = sys.argv[5]
+    
+    # Parse numeric arguments before connecting so typos fail immediately
+    try:
+        quantity = float(sys.argv[3])
+        take_profit_price = float(sys.argv[4])
+        stop_loss_price = float(sys.argv[5])
+    except ValueError as e:
+        print(f"{Fore.RED}Invalid argument:{Style.RESET_ALL} {e}")
+        sys.exit(1)
     
     try:
         bot = OCOBot(testnet=True)
@@ -128,8 +177,8 @@ def main():
         print(f"\n{Fore.GREEN}Account Balance:{Style.RESET_ALL} {balance['total_balance']} USDT\n")
         
         orders = bot.place_oco_order(
-            symbol, side, float(quantity),
-            float(take_profit_price), float(stop_loss_price)
+            symbol, side, quantity,
+            take_profit_price, stop_loss_price
         )
         
         print(f"\n{Fore.GREEN}OCO orders placed successfully!{Style.RESET_ALL}\n")
@@ -4,21 +4,23 @@ Triggers a limit order when stop price is reached
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Run as a script (python stop_limit.py) only advanced/ is on sys.path; imported
+# as advanced.stop_limit from main.py the src modules are already importable
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from binance.exceptions import BinanceAPIException
 from base_bot import BasicBot
 from logger import logger
 from validator import Validator, ValidationError
-from colorama import Fore, Style, init
-
-# Initialize colorama
-init(autoreset=True)
+from colors import Fore, Style, RULE
 
 class StopLimitBot(BasicBot):
     """Bot for executing stop-limit orders"""
     
-    def place_stop_limit_order(self, symbol, side, quantity, stop_price, limit_price, time_in_force='GTC'):
+    def place_stop_limit_order(self, symbol, side, quantity, stop_price, limit_price, time_in_force='GTC',
+                               current_price=None):
         """
         Place a stop-limit order
         
@@ -31,6 +33,7 @@ class StopLimitBot(BasicBot):
             stop_price: Price that triggers the limit order
             limit_price: Limit price for the order once triggered
             time_in_force: GTC (Good Till Cancel), IOC, FOK
+            current_price: Known market price (optional, fetched if not provided)
             
         Returns:
             Order response dict
@@ -46,11 +49,12 @@ class StopLimitBot(BasicBot):
             
             # Log order attempt
             logger.log_order('STOP_LIMIT', symbol, side, quantity, limit_price)
-            logger.info(f"Stop price: {stop_price}")
+            logger.info("Stop price: %s", stop_price)
             
-            # Get current price for reference
-            current_price = self.get_current_price(symbol)
-            logger.info(f"Current market price: {current_price}")
+            # Get current price for reference unless the caller already has it
+            if current_price is None:
+                current_price = self.get_current_price(symbol)
+            logger.info("Current market price: %s", current_price)
             
             # Validate stop price logic
             if side == 'BUY' and stop_price <= current_price:
@@ -105,7 +109,7 @@ class StopLimitBot(BasicBot):
             return order
             
         except ValidationError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             print(f"\n{Fore.RED}✗ Validation Error:{Style.RESET_ALL} {e}")
             raise
             
@@ -121,9 +125,9 @@ class StopLimitBot(BasicBot):
 
 def main():
     """CLI entry point for stop-limit orders"""
-    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}{RULE}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Binance Futures - Stop-Limit Order Bot{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+    print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
     
     # Check command line arguments
     if len(sys.argv) < 6:
@@ -145,11 +149,17 @@ def main():
     
     symbol = sys.argv[1]
     side = sys.argv[2]
-    quantity = sys.argv[3]
-    stop_price = sys.argv[4]
-    limit_price = sys.argv[5]
     time_in_force = sys.argv[6] if len(sys.argv) > 6 else 'GTC'
     
+    # Parse numeric arguments before connecting so typos fail immediately
+    try:
+        quantity = float(sys.argv[3])
+        stop_price = float(sys.argv[4])
+        limit_price = float(sys.argv[5])
+    except ValueError as e:
+        print(f"{Fore.RED}Invalid argument:{Style.RESET_ALL} {e}")
+        sys.exit(1)
+    
     try:
         # Initialize bot
         print(f"{Fore.CYAN}Initializing bot...{Style.RESET_ALL}")
@@ -163,13 +173,13 @@ def main():
         # Place stop-limit order
         print(f"{Fore.CYAN}Placing stop-limit order...{Style.RESET_ALL}")
         order = bot.place_stop_limit_order(
-            symbol, side, float(quantity), 
-            float(stop_price), float(limit_price), 
+            symbol, side, quantity,
+            stop_price, limit_price,
             time_in_force
         )
         
         print(f"\n{Fore.GREEN}Order placed successfully!{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+        print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
         
     except KeyboardInterrupt:
         print(f"\n\n{Fore.YELLOW}Operation cancelled by user{Style.RESET_ALL}")
@@ -4,21 +4,199 @@ Splits large orders into smaller chunks over time
 """
 import sys
 import os
+import signal
 import time
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+
+# Run as a script (python twap.py) only advanced/ is on sys.path; imported
+# as advanced.twap from main.py the src modules are already importable
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from binance.exceptions import BinanceAPIException
 from base_bot import BasicBot
 from logger import logger
 from validator import Validator, ValidationError
-from colorama import Fore, Style, init
+from colors import Fore, Style, RULE
+
+# Slices allowed in flight at once. A slice normally returns well before the
+# next one is due; extra workers only matter when RTT exceeds the interval.
+TWAP_MAX_WORKERS = 4
 
-# Initialize colorama
-init(autoreset=True)
+# Transient errors worth retrying a slice for: -1021 timestamp outside
+# recvWindow, -1003 too many requests
+TWAP_RETRY_CODES = (-1021, -1003)
+TWAP_MAX_RETRIES = 3
+TWAP_RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+
+# Failed slices roll their quantity into the remaining ones; this many
+# failures in a row ends the TWAP instead
+TWAP_MAX_CONSECUTIVE_FAILURES = 2
+
+def split_quantity(total_quantity, num_orders, step_size):
+    """
+    Split a quantity into equal slices that are multiples of step_size
+    
+    Args:
+        total_quantity: Total quantity as a Decimal
+        num_orders: Number of slices
+        step_size: Symbol LOT_SIZE step as a Decimal
+        
+    Returns:
+        List of Decimal slice sizes; the last slice takes the remainder
+        left by rounding the others down
+    """
+    order_size = (total_quantity / num_orders // step_size) * step_size
+    last_size = ((total_quantity - order_size * (num_orders - 1)) // step_size) * step_size
+    return [order_size] * (num_orders - 1) + [last_size]
 
 class TWAPBot(BasicBot):
     """Bot for executing TWAP orders"""
     
+    # Slices are sized from the symbol's LOT_SIZE filter
+    PRELOAD_EXCHANGE_INFO = True
+    
+    def _place_twap_slice(self, base_order, quantity):
+        """
+        Place one TWAP slice as a market order
+        
+        Transient errors are retried with exponential backoff; waiting
+        here overlaps the schedule instead of delaying the next slice.
+        
+        Args:
+            base_order: Order parameters shared by every slice
+            quantity: Slice quantity
+            
+        Returns:
+            Tuple of (success, order dict or error message)
+        """
+        for attempt in range(TWAP_MAX_RETRIES + 1):
+            try:
+                order = self.client.futures_create_order(quantity=str(quantity), **base_order)
+                return True, order
+            except BinanceAPIException as e:
+                if e.code not in TWAP_RETRY_CODES or attempt == TWAP_MAX_RETRIES:
+                    return False, e.message
+                
+                backoff = TWAP_RETRY_BACKOFF * 2 ** attempt
+                logger.warning("TWAP slice error %s, retrying in %.1fs: %s",
+                               e.code, backoff, e.message)
+                if self._stop_event.wait(backoff):
+                    return False, e.message
+                if e.code == -1021:
+                    try:
+                        self._sync_timestamp(self.client.get_server_time())
+                    except Exception as sync_error:
+                        logger.warning("TWAP timestamp resync failed: %s", sync_error)
+            except Exception as e:
+                # Network and other errors fail the slice; the schedule
+                # carries its quantity forward like any other failure
+                return False, str(e)
+    
+    def _preflight_check(self, symbol, filters, slice_sizes):
+        """
+        Check slice sizes against the symbol's filters before any order
+        
+        Returns:
+            Maximum quantity Binance accepts for one market order
+            
+        Raises:
+            ValidationError: If a slice would be rejected by Binance
+        """
+        # Slices are MARKET orders, which Binance checks against
+        # MARKET_LOT_SIZE (a much lower maxQty than LOT_SIZE on futures)
+        lot_size = filters.get('MARKET_LOT_SIZE') or filters['LOT_SIZE']
+        min_qty = Decimal(lot_size['minQty'])
+        max_qty = Decimal(lot_size['maxQty'])
+        smallest, largest = min(slice_sizes), max(slice_sizes)
+        
+        if smallest < min_qty:
+            raise ValidationError(
+                f"Order size {smallest} is below the {symbol} minimum quantity of {min_qty}"
+            )
+        if largest > max_qty:
+            raise ValidationError(
+                f"Order size {largest} exceeds the {symbol} maximum quantity of {max_qty}"
+            )
+        
+        min_notional = filters.get('MIN_NOTIONAL')
+        if min_notional:
+            notional_floor = Decimal(min_notional['notional'])
+            price = Decimal(str(self.get_current_price(symbol)))
+            if smallest * price < notional_floor:
+                raise ValidationError(
+                    f"Order value {smallest * price:.2f} is below the {symbol} "
+                    f"minimum notional of {notional_floor}"
+                )
+        
+        return max_qty
+    
+    def _execute_twap_burst(self, base_order, slice_sizes, report):
+        """Send all TWAP slices at once, MAX_BATCH_ORDERS per request"""
+        num_orders = len(slice_sizes)
+        symbol = base_order['symbol']
+        
+        # The batches are independent, so all of them go out together over
+        # the pooled keep-alive session and are reaped in order afterwards:
+        # the burst costs about one round-trip instead of one per batch
+        executor = self.get_executor()
+        batches = []
+        for start in range(0, num_orders, self.MAX_BATCH_ORDERS):
+            # stop() holds back batches not yet submitted
+            if self._stop_event.is_set():
+                break
+            sizes = slice_sizes[start:start + self.MAX_BATCH_ORDERS]
+            print(f"{Fore.YELLOW}[{start+1}-{start+len(sizes)}/{num_orders}]{Style.RESET_ALL} Placing batch of {len(sizes)} orders for {symbol}...")
+            future = executor.submit(self._place_batch, [
+                dict(base_order, quantity=size) for size in sizes
+            ])
+            batches.append((start, sizes, future))
+        
+        for start, sizes, future in batches:
+            try:
+                results = future.result()
+            except Exception as e:
+                # A failed batch must not hide the outcome of the others,
+                # which may already be live
+                message = getattr(e, 'message', str(e))
+                for offset, size in enumerate(sizes):
+                    report(start + offset + 1, size, False, message)
+                continue
+            
+            for offset, (size, result) in enumerate(zip(sizes, results)):
+                if 'orderId' in result:
+                    report(start + offset + 1, size, True, result)
+                else:
+                    report(start + offset + 1, size, False, result.get('msg'))
+    
+    def _finish_twap(self, executed_orders, total_filled, num_orders, total_quantity):
+        """Print and log the TWAP summary, returning the executed orders"""
+        if self._stop_event.is_set():
+            logger.warning("TWAP stopped after %d of %d orders", len(executed_orders), num_orders)
+            print(f"\n{Fore.YELLOW}TWAP stopped before all orders were placed{Style.RESET_ALL}")
+        
+        print(f"\n{Fore.GREEN}{RULE}{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}TWAP Execution Complete{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}{RULE}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Total Orders Executed:{Style.RESET_ALL} {len(executed_orders)}/{num_orders}")
+        print(f"{Fore.CYAN}Total Quantity Filled:{Style.RESET_ALL} {total_filled}/{total_quantity}")
+        
+        # Volume-weighted average over the fills, accumulated in one pass
+        filled_qty = notional = Decimal(0)
+        for order in executed_orders:
+            qty = Decimal(order['executedQty'])
+            filled_qty += qty
+            notional += qty * Decimal(order.get('avgPrice', '0'))
+        
+        if filled_qty:
+            avg_price = float(notional / filled_qty)
+            print(f"{Fore.CYAN}Average Execution Price (VWAP):{Style.RESET_ALL} {avg_price}")
+        
+        logger.info(f"TWAP execution complete: {len(executed_orders)} orders, {total_filled} filled")
+        
+        return executed_orders
+    
     def execute_twap_order(self, symbol, side, total_quantity, num_orders, interval_seconds):
         """
         Execute a TWAP order by splitting into smaller market orders over time
@@ -28,7 +206,8 @@ class TWAPBot(BasicBot):
             side: BUY or SELL
             total_quantity: Total quantity to trade
             num_orders: Number of orders to split into
-            interval_seconds: Time interval between orders (in seconds)
+            interval_seconds: Time interval between orders (in seconds);
+                0 sends all orders immediately in batches of MAX_BATCH_ORDERS
             
         Returns:
             List of executed orders
@@ -43,12 +222,26 @@ class TWAPBot(BasicBot):
                 raise ValidationError("Number of orders must be at least 2")
             if num_orders > 100:
                 raise ValidationError("Number of orders cannot exceed 100")
-            if interval_seconds < 1:
-                raise ValidationError("Interval must be at least 1 second")
+            if interval_seconds != 0 and interval_seconds < 1:
+                raise ValidationError("Interval must be 0 (burst) or at least 1 second")
+            
+            # Split in exact decimal steps so every slice passes LOT_SIZE
+            filters = self.get_symbol_filters(symbol)
+            if 'LOT_SIZE' not in filters:
+                raise ValueError(f"No LOT_SIZE filter for {symbol}")
+            step_size = Decimal(filters['LOT_SIZE']['stepSize'])
+            total_quantity = Decimal(str(total_quantity))
+            
+            slice_sizes = split_quantity(total_quantity, num_orders, step_size)
+            order_size = slice_sizes[0]
+            if order_size <= 0:
+                raise ValidationError(
+                    f"Order size is below the {symbol} step size of {step_size}"
+                )
+            Validator.validate_quantity(order_size)
             
-            # Calculate order size
-            order_size = total_quantity / num_orders
-            order_size = Validator.validate_quantity(order_size)
+            # Reject sizes Binance would refuse before sending anything
+            max_qty = self._preflight_check(symbol, filters, slice_sizes)
             
             logger.info(f"Starting TWAP order: {total_quantity} {symbol} split into {num_orders} orders")
             logger.info(f"Order size: {order_size}, Interval: {interval_seconds}s")
@@ -62,61 +255,95 @@ class TWAPBot(BasicBot):
             print(f"  Interval: {interval_seconds} seconds")
             print(f"  Total Duration: {(num_orders - 1) * interval_seconds} seconds\n")
             
+            # Parameters shared by every slice, built once
+            base_order = {'symbol': symbol, 'side': side, 'type': 'MARKET'}
+            
+            self._stop_event.clear()
+            
             executed_orders = []
-            total_filled = 0
-            
-            for i in range(num_orders):
-                try:
-                    # Adjust last order to account for rounding
-                    if i == num_orders - 1:
-                        remaining = total_quantity - total_filled
-                        current_order_size = remaining
-                    else:
-                        current_order_size = order_size
-                    
-                    print(f"{Fore.YELLOW}[{i+1}/{num_orders}]{Style.RESET_ALL} Placing order for {current_order_size} {symbol}...")
-                    
-                    # Place market order
-                    order = self.client.futures_create_order(
-                        symbol=symbol,
-                        side=side,
-                        type='MARKET',
-                        quantity=current_order_size
-                    )
-                    
-                    executed_orders.append(order)
-                    filled_qty = float(order['executedQty'])
+            total_filled = Decimal(0)
+            failed = False
+            
+            # Quantity from failed slices still to be spread over later ones
+            carry = Decimal(0)
+            consecutive_failures = 0
+            
+            # (slice number, size, future) for slices awaiting a response
+            pending = []
+            
+            def report(slice_no, size, ok, result):
+                nonlocal total_filled, failed, carry, consecutive_failures
+                if ok:
+                    consecutive_failures = 0
+                    executed_orders.append(result)
+                    filled_qty = Decimal(result['executedQty'])
                     total_filled += filled_qty
                     
-                    logger.log_order('TWAP', symbol, side, current_order_size, status='FILLED')
-                    logger.info(f"TWAP order {i+1}/{num_orders} filled: {filled_qty}")
-                    
-                    print(f"{Fore.GREEN}✓ Order {i+1} filled: {filled_qty} @ Market{Style.RESET_ALL}")
+                    logger.log_order('TWAP', symbol, side, size, status='FILLED')
+                    logger.info(f"TWAP order {slice_no}/{num_orders} filled: {filled_qty}")
                     
-                    # Wait before next order (except for last order)
-                    if i < num_orders - 1:
-                        print(f"{Fore.CYAN}Waiting {interval_seconds} seconds...{Style.RESET_ALL}\n")
-                        time.sleep(interval_seconds)
-                    
-                except BinanceAPIException as e:
-                    logger.error(f"Error placing TWAP order {i+1}: {e.message}")
-                    print(f"{Fore.RED}✗ Error on order {i+1}: {e.message}{Style.RESET_ALL}")
-                    break
+                    print(f"{Fore.GREEN}✓ Order {slice_no} filled: {filled_qty} @ Market{Style.RESET_ALL}")
+                else:
+                    carry += size
+                    consecutive_failures += 1
+                    failed = consecutive_failures >= TWAP_MAX_CONSECUTIVE_FAILURES
+                    logger.error(f"Error placing TWAP order {slice_no}: {result}")
+                    print(f"{Fore.RED}✗ Error on order {slice_no}: {result}{Style.RESET_ALL}")
             
-            # Summary
-            print(f"\n{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}TWAP Execution Complete{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Total Orders Executed:{Style.RESET_ALL} {len(executed_orders)}/{num_orders}")
-            print(f"{Fore.CYAN}Total Quantity Filled:{Style.RESET_ALL} {total_filled}/{total_quantity}")
+            if interval_seconds == 0:
+                self._execute_twap_burst(base_order, slice_sizes, report)
+                return self._finish_twap(executed_orders, total_filled, num_orders, total_quantity)
             
-            if executed_orders:
-                avg_price = sum(float(o.get('avgPrice', 0)) for o in executed_orders) / len(executed_orders)
-                print(f"{Fore.CYAN}Average Execution Price:{Style.RESET_ALL} {avg_price}")
+            # Loop-invariant output templates and lookups, bound once
+            waiting_fmt = f"{Fore.CYAN}Waiting %.1f seconds...{Style.RESET_ALL}\n"
+            placing_fmt = f"{Fore.YELLOW}[%d/{num_orders}]{Style.RESET_ALL} Placing order for %s {symbol}..."
+            place_slice = self._place_twap_slice
+            monotonic = time.monotonic
             
-            logger.info(f"TWAP execution complete: {len(executed_orders)} orders, {total_filled} filled")
+            # Each slice is submitted at its scheduled time, t0 + i * interval,
+            # and runs in the background, so the order round-trip overlaps the
+            # wait for the next slice instead of delaying it
+            start_time = monotonic()
+            with ThreadPoolExecutor(max_workers=TWAP_MAX_WORKERS) as executor:
+                submit = executor.submit
+                for i in range(num_orders):
+                    if i > 0:
+                        # Sleep only the time left until this slice's deadline
+                        deadline = start_time + i * interval_seconds
+                        wait = max(0.0, deadline - monotonic())
+                        print(waiting_fmt % wait)
+                        if self._stop_event.wait(wait):
+                            break
+                        logger.debug("TWAP slice %d drift: %.1fms",
+                                     i + 1, (monotonic() - deadline) * 1000)
+                    
+                    # Report slices that completed while waiting
+                    while pending and pending[0][2].done():
+                        slice_no, size, future = pending.pop(0)
+                        report(slice_no, size, *future.result())
+                    if failed:
+                        break
+                    
+                    current_order_size = slice_sizes[i]
+                    if carry:
+                        # Spread missed quantity evenly; the last slice takes the rest
+                        remaining = num_orders - i
+                        extra = carry if remaining == 1 else (carry / remaining // step_size) * step_size
+                        # Never push a slice over the market order maximum;
+                        # what does not fit stays unfilled
+                        extra = min(extra, max_qty - current_order_size)
+                        current_order_size += extra
+                        carry -= extra
+                    
+                    print(placing_fmt % (i + 1, current_order_size))
+                    
+                    future = submit(place_slice, base_order, current_order_size)
+                    pending.append((i + 1, current_order_size, future))
+                
+                for slice_no, size, future in pending:
+                    report(slice_no, size, *future.result())
             
-            return executed_orders
+            return self._finish_twap(executed_orders, total_filled, num_orders, total_quantity)
             
         except ValidationError as e:
             logger.error(f"Validation error: {e}")
@@ -129,9 +356,9 @@ class TWAPBot(BasicBot):
 
 def main():
     """CLI entry point for TWAP orders"""
-    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}{RULE}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Binance Futures - TWAP Order Bot{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+    print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
     
     if len(sys.argv) < 6:
         print(f"{Fore.RED}Usage:{Style.RESET_ALL} python twap.py <SYMBOL> <SIDE> <TOTAL_QTY> <NUM_ORDERS> <INTERVAL_SEC>")
@@ -143,7 +370,7 @@ def main():
         print(f"  SIDE         - BUY or SELL")
         print(f"  TOTAL_QTY    - Total quantity to trade")
         print(f"  NUM_ORDERS   - Number of orders to split into (2-100)")
-        print(f"  INTERVAL_SEC - Seconds between orders")
+        print(f"  INTERVAL_SEC - Seconds between orders (0 = all at once, batched 5 per request)")
         sys.exit(1)
     
     symbol = sys.argv[1]
@@ -157,6 +384,14 @@ def main():
         balance = bot.get_account_balance()
         print(f"{Fore.GREEN}Account Balance:{Style.RESET_ALL} {balance['total_balance']} USDT\n")
         
+        # First Ctrl-C stops the TWAP after in-flight slices are reported;
+        # a second one interrupts immediately
+        def handle_sigint(signum, frame):
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            print(f"\n{Fore.YELLOW}Stopping TWAP... (Ctrl-C again to abort){Style.RESET_ALL}")
+            bot.stop()
+        signal.signal(signal.SIGINT, handle_sigint)
+        
         orders = bot.execute_twap_order(
             symbol, side, float(total_quantity),
             int(num_orders), int(interval_seconds)
@@ -2,16 +2,37 @@
 Base bot class for Binance Futures trading
 Provides core functionality for all order types
 """
-from binance.client import Client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from binance.exceptions import BinanceAPIException, BinanceRequestException
+from client_factory import get_client
 from config import Config
 from logger import logger
+from market_data import BinanceTickerStream
 from validator import Validator, ValidationError
 
 class BasicBot:
     """Base trading bot with core Binance Futures functionality"""
     
-    def __init__(self, api_key=None, api_secret=None, testnet=True):
+    # Exchange rules shared by every bot in the process:
+    # monotonic fetch time and symbol -> symbol info
+    _exchange_info_cache = {"ts": 0.0, "by_symbol": {}}
+    
+    # Largest batch accepted by the batchOrders endpoint
+    MAX_BATCH_ORDERS = 5
+    
+    # Subclasses that need trading rules for every order set this so the
+    # exchange info is fetched alongside the startup requests
+    PRELOAD_EXCHANGE_INFO = False
+    
+    # Worker threads shared by every bot for overlapping short REST calls,
+    # created on first use and kept for the life of the process
+    EXECUTOR_MAX_WORKERS = 8
+    _executor = None
+    _executor_lock = threading.Lock()
+    
+    def __init__(self, api_key=None, api_secret=None, testnet=True, verbose=True):
         """
         Initialize the trading bot
         
@@ -19,10 +40,23 @@ class BasicBot:
             api_key: Binance API key (optional, reads from config if not provided)
             api_secret: Binance API secret (optional, reads from config if not provided)
             testnet: Use testnet (default: True)
+            verbose: Print human-readable order summaries (default: True);
+                programmatic callers can turn this off and rely on the log
         """
         self.api_key = api_key or Config.API_KEY
         self.api_secret = api_secret or Config.API_SECRET
         self.testnet = testnet
+        self.verbose = verbose
+        
+        # symbol -> (monotonic timestamp, price)
+        self._price_cache = {}
+        self.ticker_stream = None
+        
+        # (monotonic timestamp, futures account dict)
+        self._account_cache = None
+        
+        # Set by stop() to cut long-running strategies short
+        self._stop_event = threading.Event()
         
         # Validate credentials
         if not self.api_key or not self.api_secret:
@@ -30,43 +64,96 @@ class BasicBot:
         
         # Initialize Binance client
         try:
-            self.client = Client(self.api_key, self.api_secret, testnet=self.testnet)
-            
-            # Set testnet URL if using testnet
-            if self.testnet:
-                self.client.API_URL = 'https://testnet.binancefuture.com'
-            
-            # Sync timestamp with server to avoid timestamp errors
-            try:
-                server_time = self.client.get_server_time()
-                import time
-                local_time = int(time.time() * 1000)
-                time_offset = server_time['serverTime'] - local_time
-                self.client.timestamp_offset = time_offset
-                logger.debug(f"Timestamp offset set to {time_offset}ms")
-            except:
-                # If timestamp sync fails, continue without it
-                pass
+            self.client = get_client(self.api_key, self.api_secret, self.testnet)
             
             logger.info(f"Bot initialized - Testnet: {self.testnet}")
             
             # Test connection
-            self._test_connection()
+            self._bootstrap()
+            
+            if Config.PRICE_STREAM:
+                self.start_ticker_stream()
             
         except Exception as e:
             logger.log_error_trace(e, "Failed to initialize bot")
             raise
     
-    def _test_connection(self):
-        """Test API connection"""
+    @classmethod
+    def get_executor(cls):
+        """Get the shared thread pool, creating it on first use"""
+        with BasicBot._executor_lock:
+            if BasicBot._executor is None:
+                BasicBot._executor = ThreadPoolExecutor(
+                    max_workers=cls.EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix='bot-io'
+                )
+            return BasicBot._executor
+    
+    def stop(self):
+        """Ask a running strategy to stop before its next order"""
+        self._stop_event.set()
+        self.stop_ticker_stream()
+    
+    def _sync_timestamp(self, server_time):
+        """Set the client's timestamp offset from a server time response"""
+        local_time = time.time_ns() // 1_000_000
+        time_offset = server_time['serverTime'] - local_time
+        self.client.timestamp_offset = time_offset
+        logger.debug(f"Timestamp offset set to {time_offset}ms")
+    
+    def _bootstrap(self):
+        """
+        Test API connection, sync server time and load the account
+        
+        The requests are independent, so they run concurrently and startup
+        costs one round-trip instead of three. Exchange info is loaded in
+        the same round-trip when PRELOAD_EXCHANGE_INFO is set and the
+        shared cache is stale.
+        """
         try:
             logger.log_api_call("ping")
-            self.client.futures_ping()
+            logger.log_api_call("time")
+            logger.log_api_call("account")
+            
+            preload = (
+                self.PRELOAD_EXCHANGE_INFO
+                and time.monotonic() - BasicBot._exchange_info_cache["ts"] >= Config.EXCHANGE_INFO_TTL
+            )
+            
+            executor = self.get_executor()
+            ping_future = executor.submit(self.client.futures_ping)
+            time_future = executor.submit(self.client.get_server_time)
+            account_future = executor.submit(self.client.futures_account)
+            if preload:
+                logger.log_api_call("exchangeInfo")
+                info_future = executor.submit(self.client.futures_exchange_info)
+                
+            # Sync timestamp with server to avoid timestamp errors
+            try:
+                self._sync_timestamp(time_future.result())
+            except Exception:
+                # If timestamp sync fails, continue without it
+                pass
+                
+            ping_future.result()
             logger.info("API connection successful")
             
-            # Get account info
-            logger.log_api_call("account")
-            account = self.client.futures_account()
+            try:
+                account = account_future.result()
+            except BinanceAPIException as e:
+                # -1021: signed before the offset was known; retry with it
+                if e.code != -1021:
+                    raise
+                account = self.client.futures_account()
+                
+            if preload:
+                try:
+                    self._store_exchange_info(info_future.result())
+                except Exception as e:
+                    # get_symbol_info fetches it again when needed
+                    logger.warning("Exchange info preload failed: %s", e)
+            
+            self._account_cache = (time.monotonic(), account)
             balance = float(account['totalWalletBalance'])
             logger.info(f"Account Balance: {balance} USDT")
             
@@ -77,10 +164,22 @@ class BasicBot:
             logger.log_error_trace(e, "Connection test failed")
             raise
     
+    @staticmethod
+    def _store_exchange_info(exchange_info):
+        """Replace the shared exchange info cache, indexed by symbol"""
+        BasicBot._exchange_info_cache = {
+            "ts": time.monotonic(),
+            "by_symbol": {s['symbol']: s for s in exchange_info['symbols']}
+        }
+    
     def get_symbol_info(self, symbol):
         """
         Get symbol information and trading rules
         
+        Exchange info is cached for Config.EXCHANGE_INFO_TTL seconds and
+        indexed by symbol. A cached entry is only reused while it still
+        has filters and a TRADING status; otherwise it is refetched.
+        
         Args:
             symbol: Trading pair symbol
             
@@ -89,16 +188,23 @@ class BasicBot:
         """
         try:
             symbol = Validator.validate_symbol(symbol)
+            
+            cache = BasicBot._exchange_info_cache
+            if time.monotonic() - cache["ts"] < Config.EXCHANGE_INFO_TTL:
+                info = cache["by_symbol"].get(symbol)
+                if info and info.get('filters') and info.get('status') == 'TRADING':
+                    return info
+            
             logger.log_api_call("exchangeInfo", {"symbol": symbol})
             
-            exchange_info = self.client.futures_exchange_info()
+            self._store_exchange_info(self.client.futures_exchange_info())
             
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    logger.debug(f"Symbol info retrieved: {symbol}")
-                    return s
+            info = BasicBot._exchange_info_cache["by_symbol"].get(symbol)
+            if info is None:
+                raise ValueError(f"Symbol not found: {symbol}")
             
-            raise ValueError(f"Symbol not found: {symbol}")
+            logger.debug(f"Symbol info retrieved: {symbol}")
+            return info
             
         except ValidationError as e:
             logger.error(f"Validation error: {e}")
@@ -107,10 +213,27 @@ class BasicBot:
             logger.log_error_trace(e, f"Failed to get symbol info for {symbol}")
             raise
     
+    def get_symbol_filters(self, symbol):
+        """
+        Get the trading rule filters for a symbol
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Dict mapping filter type (e.g. LOT_SIZE, MIN_NOTIONAL) to filter
+        """
+        return {f['filterType']: f for f in self.get_symbol_info(symbol)['filters']}
+    
     def get_current_price(self, symbol):
         """
         Get current market price for a symbol
         
+        Uses the live ticker stream when one is running and its price is
+        fresh; otherwise prices fetched within the last
+        Config.PRICE_CACHE_TTL seconds are served from cache instead of
+        issuing another REST call.
+        
         Args:
             symbol: Trading pair symbol
             
@@ -119,10 +242,16 @@ class BasicBot:
         """
         try:
             symbol = Validator.validate_symbol(symbol)
+            
+            price = self.get_cached_price(symbol)
+            if price is not None:
+                return price
+            
             logger.log_api_call("ticker/price", {"symbol": symbol})
             
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
             price = float(ticker['price'])
+            self._price_cache[symbol] = (time.monotonic(), price)
             
             logger.debug(f"Current price for {symbol}: {price}")
             return price
@@ -134,16 +263,140 @@ class BasicBot:
             logger.log_error_trace(e, f"Failed to get price for {symbol}")
             raise
     
+    def start_ticker_stream(self):
+        """
+        Serve get_current_price from a live WebSocket ticker stream
+        
+        REST is still used for symbols the stream has not reported within
+        Config.STREAM_PRICE_MAX_AGE seconds.
+        """
+        if self.ticker_stream is None:
+            self.ticker_stream = BinanceTickerStream(testnet=self.testnet)
+        if not self.ticker_stream.start():
+            self.ticker_stream = None
+    
+    def stop_ticker_stream(self):
+        """Stop the live ticker stream and fall back to REST prices"""
+        if self.ticker_stream:
+            self.ticker_stream.stop()
+            self.ticker_stream = None
+    
+    def get_cached_price(self, symbol, max_age=None):
+        """
+        Get a fresh price for a symbol without making a REST call
+        
+        Args:
+            symbol: Validated trading pair symbol
+            max_age: Maximum age in seconds of a cached REST price
+                (default: Config.PRICE_CACHE_TTL)
+            
+        Returns:
+            Price from the ticker stream or price cache, or None if neither
+            holds a fresh one
+        """
+        if max_age is None:
+            max_age = Config.PRICE_CACHE_TTL
+        
+        if self.ticker_stream:
+            price = self.ticker_stream.get_price(symbol)
+            if price is not None:
+                return price
+        
+        cached = self._price_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        return None
+    
+    def _place_with_reference_price(self, symbol, current_price, **params):
+        """
+        Place an order while looking up a display-only market price
+        
+        The reference price must not delay the order: a cached price is
+        used when fresh enough, otherwise it is fetched alongside the order.
+        
+        Args:
+            symbol: Validated trading pair symbol
+            current_price: Reference price the caller already has, or None
+            **params: Remaining futures_create_order parameters
+            
+        Returns:
+            Tuple of (order response, reference price or None)
+        """
+        if current_price is None:
+            current_price = self.get_cached_price(symbol, Config.REFERENCE_PRICE_MAX_AGE)
+        
+        price_future = None
+        if current_price is None:
+            price_future = self.get_executor().submit(self.get_current_price, symbol)
+        
+        order = self.client.futures_create_order(symbol=symbol, **params)
+        
+        if price_future is not None:
+            try:
+                current_price = price_future.result()
+            except Exception:
+                # Already logged; the order itself went through
+                current_price = None
+        
+        return order, current_price
+    
+    def get_current_prices(self, symbols):
+        """
+        Get current market prices for several symbols in one request
+        
+        Args:
+            symbols: List of trading pair symbols
+            
+        Returns:
+            Dict mapping symbol to current price
+        """
+        try:
+            symbols = [Validator.validate_symbol(s) for s in symbols]
+            logger.log_api_call("ticker/price")
+            
+            # Without a symbol the endpoint returns every ticker at once
+            tickers = self.client.futures_symbol_ticker()
+            latest = {t['symbol']: float(t['price']) for t in tickers}
+            
+            now = time.monotonic()
+            for symbol, price in latest.items():
+                self._price_cache[symbol] = (now, price)
+            
+            prices = {}
+            for symbol in symbols:
+                if symbol not in latest:
+                    raise ValueError(f"Symbol not found: {symbol}")
+                prices[symbol] = latest[symbol]
+            
+            logger.debug(f"Current prices: {prices}")
+            return prices
+            
+        except ValidationError as e:
+            logger.error(f"Validation error: {e}")
+            raise
+        except Exception as e:
+            logger.log_error_trace(e, f"Failed to get prices for {symbols}")
+            raise
+    
     def get_account_balance(self):
         """
         Get account balance
         
+        Reuses the account fetched within the last
+        Config.ACCOUNT_CACHE_TTL seconds (e.g. during startup) instead of
+        requesting it again.
+        
         Returns:
             Account balance information
         """
         try:
-            logger.log_api_call("account")
-            account = self.client.futures_account()
+            cached = self._account_cache
+            if cached and time.monotonic() - cached[0] < Config.ACCOUNT_CACHE_TTL:
+                account = cached[1]
+            else:
+                logger.log_api_call("account")
+                account = self.client.futures_account()
+                self._account_cache = (time.monotonic(), account)
             
             balance_info = {
                 'total_balance': float(account['totalWalletBalance']),
@@ -195,6 +448,29 @@ class BasicBot:
             logger.log_error_trace(e, "Unexpected error setting leverage")
             raise
     
+    def _place_batch(self, orders):
+        """
+        Place several orders in one signed request
+        
+        Args:
+            orders: List of up to MAX_BATCH_ORDERS order parameter dicts
+            
+        Returns:
+            List with one entry per order, in order: the order dict, or a
+            dict with 'code' and 'msg' if that order was rejected
+        """
+        if len(orders) > self.MAX_BATCH_ORDERS:
+            raise ValueError(f"Batch cannot exceed {self.MAX_BATCH_ORDERS} orders")
+        
+        # python-binance serialises the list itself and expects string values
+        batch = [{key: str(value) for key, value in order.items()} for order in orders]
+        
+        logger.log_api_call("batchOrders", {"batchOrders": batch})
+        response = self.client.futures_place_batch_order(batchOrders=batch)
+        logger.log_api_response(response)
+        
+        return response
+    
     def get_open_orders(self, symbol=None):
         """
         Get all open orders
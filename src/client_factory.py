@@ -0,0 +1,118 @@
+"""
+Client factory for Binance Futures Trading Bot
+Shares one configured Binance client per set of credentials
+"""
+import hashlib
+import hmac
+import threading
+from binance.client import Client
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import Config
+from rate_limiter import RateLimiter, rate_limited
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# (api_key, api_secret, testnet) -> Client
+_clients = {}
+_lock = threading.Lock()
+
+# Binance limits are enforced per IP and account, so every client shares one
+_rate_limiter = RateLimiter(
+    Config.RATE_LIMIT_WEIGHT_PER_MINUTE,
+    Config.RATE_LIMIT_ORDERS_PER_10S
+)
+
+class BotClient(Client):
+    """Binance client tuned for the bot's REST usage"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Key the HMAC once; each signature copies this state instead of
+        # re-deriving the inner and outer pads from the secret
+        self._hmac_template = None
+        if self.API_SECRET:
+            self._hmac_template = hmac.new(self.API_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
+    
+    def _hmac_signature(self, query_string):
+        """Sign a query string from the precomputed HMAC state"""
+        assert self._hmac_template, "API Secret required for private endpoints"
+        signature = self._hmac_template.copy()
+        signature.update(query_string.encode('utf-8'))
+        return signature.hexdigest()
+    
+    @staticmethod
+    def _handle_response(response):
+        """Decode API responses with orjson when it is installed"""
+        if orjson is None:
+            return Client._handle_response(response)
+        
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return orjson.loads(response.content)
+        except ValueError:
+            raise BinanceRequestException('Invalid Response: %s' % response.text)
+
+def _configure_session(client):
+    """Mount a pooled, retrying adapter on the client's HTTP session"""
+    retry = Retry(
+        total=Config.HTTP_MAX_RETRIES,
+        backoff_factor=Config.HTTP_BACKOFF_FACTOR,
+        status_forcelist=Config.HTTP_RETRY_STATUSES,
+        # Hand the last response back once retries run out, so it still
+        # becomes a BinanceAPIException with its error code
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+        max_retries=retry
+    )
+    client.session.mount('https://', adapter)
+    client.session.headers.update({'Connection': 'keep-alive'})
+
+def get_client(api_key=None, api_secret=None, testnet=True):
+    """
+    Get a shared Binance client
+    
+    The first call for a given set of credentials creates and configures
+    the client; later calls reuse it along with its open connections.
+    
+    Args:
+        api_key: Binance API key (optional, reads from config if not provided)
+        api_secret: Binance API secret (optional, reads from config if not provided)
+        testnet: Use testnet (default: True)
+        
+    Returns:
+        Configured BotClient
+    """
+    api_key = api_key or Config.API_KEY
+    api_secret = api_secret or Config.API_SECRET
+    key = (api_key, api_secret, testnet)
+    
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = BotClient(api_key, api_secret, testnet=testnet)
+            _configure_session(client)
+            
+            # Throttle order placement and track server-reported usage
+            client.session.hooks['response'].append(_rate_limiter.update_from_response)
+            client.futures_create_order = rate_limited(_rate_limiter)(client.futures_create_order)
+            client.futures_place_batch_order = rate_limited(_rate_limiter, weight=5, orders=5)(
+                client.futures_place_batch_order
+            )
+            
+            # Set testnet URL if using testnet
+            if testnet:
+                client.API_URL = Config.TESTNET_BASE_URL
+            
+            _clients[key] = client
+    
+    return client
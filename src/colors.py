@@ -0,0 +1,32 @@
+"""
+Terminal color module for Binance Futures Trading Bot
+Loads colorama only when output goes to an interactive terminal
+"""
+import os
+import sys
+
+# Horizontal rule for banners and summaries
+RULE = '=' * 60
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that yields empty strings"""
+    
+    def __getattr__(self, name):
+        # Store the blank so later lookups are plain attribute hits
+        setattr(self, name, '')
+        return ''
+
+# Honor the NO_COLOR convention and skip escape codes for pipes and log capture
+USE_COLOR = (
+    sys.stdout is not None
+    and sys.stdout.isatty()
+    and 'NO_COLOR' not in os.environ
+)
+
+if USE_COLOR:
+    from colorama import Fore, Style, init
+    
+    # Initialize colorama
+    init(autoreset=True)
+else:
+    Fore = Style = _NoColor()
@@ -3,34 +3,66 @@ Configuration module for Binance Futures Trading Bot
 Handles API credentials and testnet settings
 """
 import os
+from typing import Final
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-class Config:
+class _FrozenConfig(type):
+    """Metaclass that makes Config attributes read-only after import"""
+    
+    def __setattr__(cls, name, value):
+        raise AttributeError(f"Config.{name} is read-only")
+    
+    def __delattr__(cls, name):
+        raise AttributeError(f"Config.{name} is read-only")
+
+class Config(metaclass=_FrozenConfig):
     """Configuration class for bot settings"""
     
     # API Credentials
-    API_KEY = os.getenv('BINANCE_API_KEY', '')
-    API_SECRET = os.getenv('BINANCE_API_SECRET', '')
+    API_KEY: Final = os.getenv('BINANCE_API_KEY', '')
+    API_SECRET: Final = os.getenv('BINANCE_API_SECRET', '')
     
     # Testnet Settings
-    TESTNET = os.getenv('TESTNET', 'True').lower() == 'true'
-    TESTNET_BASE_URL = 'https://testnet.binancefuture.com'
+    TESTNET: Final = os.getenv('TESTNET', 'True').lower() == 'true'
+    TESTNET_BASE_URL: Final = 'https://testnet.binancefuture.com'
     
     # Logging Settings
-    LOG_FILE = 'bot.log'
-    LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    LOG_FILE: Final = 'bot.log'
+    LOG_FILE_LEVEL: Final = os.getenv('LOG_FILE_LEVEL', 'INFO').upper()
+    LOG_FORMAT: Final = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    LOG_DATE_FORMAT: Final = '%Y-%m-%d %H:%M:%S'
+    
+    # HTTP Settings
+    HTTP_POOL_CONNECTIONS: Final = 10
+    HTTP_POOL_MAXSIZE: Final = 50
+    HTTP_MAX_RETRIES: Final = 3
+    HTTP_BACKOFF_FACTOR: Final = 0.3
+    HTTP_RETRY_STATUSES: Final = (429, 500, 502, 503, 504)
+    
+    # Rate Limit Settings
+    RATE_LIMIT_WEIGHT_PER_MINUTE: Final = 1200
+    RATE_LIMIT_ORDERS_PER_10S: Final = 50
+    
+    # Market Data Settings
+    PRICE_CACHE_TTL: Final = 0.5  # seconds
+    REFERENCE_PRICE_MAX_AGE: Final = 2.0  # seconds, for display-only prices
+    # Serve prices from the WebSocket ticker stream instead of REST
+    PRICE_STREAM: Final = os.getenv('PRICE_STREAM', 'False').lower() == 'true'
+    STREAM_PRICE_MAX_AGE: Final = 2.0  # seconds
+    STREAM_CONNECT_TIMEOUT: Final = 10.0  # seconds
+    EXCHANGE_INFO_TTL: Final = 300  # seconds
+    ACCOUNT_CACHE_TTL: Final = 2.0  # seconds
     
     # Trading Settings
-    DEFAULT_LEVERAGE = 10
-    MAX_LEVERAGE = 125
+    DEFAULT_LEVERAGE: Final = 10
+    MAX_LEVERAGE: Final = 125
     
     # Validation Settings
-    MIN_QUANTITY = 0.001
-    MAX_QUANTITY = 10000
+    MIN_QUANTITY: Final = 0.001
+    MAX_QUANTITY: Final = 10000
     
     @classmethod
     def validate(cls):
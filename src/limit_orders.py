@@ -7,15 +7,12 @@ from binance.exceptions import BinanceAPIException
 from base_bot import BasicBot
 from logger import logger
 from validator import Validator, ValidationError
-from colorama import Fore, Style, init
-
-# Initialize colorama
-init(autoreset=True)
+from colors import Fore, Style, RULE
 
 class LimitOrderBot(BasicBot):
     """Bot for executing limit orders"""
     
-    def place_limit_order(self, symbol, side, quantity, price, time_in_force='GTC'):
+    def place_limit_order(self, symbol, side, quantity, price, time_in_force='GTC', current_price=None):
         """
         Place a limit order
         
@@ -25,6 +22,7 @@ class LimitOrderBot(BasicBot):
             quantity: Order quantity
             price: Limit price
             time_in_force: GTC (Good Till Cancel), IOC (Immediate or Cancel), FOK (Fill or Kill)
+            current_price: Reference market price (optional, looked up if not provided)
             
         Returns:
             Order response dict
@@ -40,15 +38,6 @@ class LimitOrderBot(BasicBot):
             # Log order attempt
             logger.log_order('LIMIT', symbol, side, quantity, price)
             
-            # Get current price for reference
-            current_price = self.get_current_price(symbol)
-            logger.info(f"Current market price: {current_price}")
-            logger.info(f"Limit price: {price}")
-            
-            # Calculate price difference
-            price_diff_pct = ((price - current_price) / current_price) * 100
-            logger.info(f"Price difference: {price_diff_pct:.2f}%")
-            
             # Place limit order
             logger.log_api_call("newOrder", {
                 "symbol": symbol,
@@ -59,8 +48,9 @@ class LimitOrderBot(BasicBot):
                 "timeInForce": time_in_force
             })
             
-            order = self.client.futures_create_order(
-                symbol=symbol,
+            order, current_price = self._place_with_reference_price(
+                symbol,
+                current_price,
                 side=side,
                 type='LIMIT',
                 quantity=quantity,
@@ -68,21 +58,30 @@ class LimitOrderBot(BasicBot):
                 timeInForce=time_in_force
             )
             
+            # Calculate price difference
+            price_diff_pct = None
+            if current_price:
+                price_diff_pct = ((price - current_price) / current_price) * 100
+                logger.debug("Current market price: %s, limit price: %s, difference: %.2f%%",
+                             current_price, price, price_diff_pct)
+            
             # Log successful order
             logger.log_order('LIMIT', symbol, side, quantity, price, order['status'])
             logger.log_api_response(order)
             
             # Print success message
-            print(f"\n{Fore.GREEN}✓ Limit Order Placed Successfully!{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Order ID:{Style.RESET_ALL} {order['orderId']}")
-            print(f"{Fore.CYAN}Symbol:{Style.RESET_ALL} {order['symbol']}")
-            print(f"{Fore.CYAN}Side:{Style.RESET_ALL} {order['side']}")
-            print(f"{Fore.CYAN}Quantity:{Style.RESET_ALL} {order['origQty']}")
-            print(f"{Fore.CYAN}Limit Price:{Style.RESET_ALL} {order['price']}")
-            print(f"{Fore.CYAN}Current Price:{Style.RESET_ALL} {current_price}")
-            print(f"{Fore.CYAN}Price Difference:{Style.RESET_ALL} {price_diff_pct:.2f}%")
-            print(f"{Fore.CYAN}Status:{Style.RESET_ALL} {order['status']}")
-            print(f"{Fore.CYAN}Time in Force:{Style.RESET_ALL} {order['timeInForce']}")
+            if self.verbose:
+                print(f"\n{Fore.GREEN}✓ Limit Order Placed Successfully!{Style.RESET_ALL}")
+                print(f"{Fore.CYAN}Order ID:{Style.RESET_ALL} {order['orderId']}")
+                print(f"{Fore.CYAN}Symbol:{Style.RESET_ALL} {order['symbol']}")
+                print(f"{Fore.CYAN}Side:{Style.RESET_ALL} {order['side']}")
+                print(f"{Fore.CYAN}Quantity:{Style.RESET_ALL} {order['origQty']}")
+                print(f"{Fore.CYAN}Limit Price:{Style.RESET_ALL} {order['price']}")
+                if price_diff_pct is not None:
+                    print(f"{Fore.CYAN}Current Price:{Style.RESET_ALL} {current_price}")
+                    print(f"{Fore.CYAN}Price Difference:{Style.RESET_ALL} {price_diff_pct:.2f}%")
+                print(f"{Fore.CYAN}Status:{Style.RESET_ALL} {order['status']}")
+                print(f"{Fore.CYAN}Time in Force:{Style.RESET_ALL} {order['timeInForce']}")
             
             return order
             
@@ -103,9 +102,9 @@ class LimitOrderBot(BasicBot):
 
 def main():
     """CLI entry point for limit orders"""
-    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}{RULE}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Binance Futures - Limit Order Bot{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+    print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
     
     # Check command line arguments
     if len(sys.argv) < 5:
@@ -147,7 +146,7 @@ def main():
         
         print(f"\n{Fore.GREEN}Order placed successfully!{Style.RESET_ALL}")
         print(f"\n{Fore.YELLOW}Note:{Style.RESET_ALL} This is a limit order. It will be filled when the market price reaches your limit price.")
-        print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+        print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
         
     except KeyboardInterrupt:
         print(f"\n\n{Fore.YELLOW}Operation cancelled by user{Style.RESET_ALL}")
@@ -2,29 +2,33 @@
 Logging module for Binance Futures Trading Bot
 Provides structured logging with timestamps and error traces
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from config import Config
 
+LOGGER_NAME = 'BinanceFuturesBot'
+
 class BotLogger:
     """Custom logger for trading bot operations"""
     
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(BotLogger, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
+        # logging.getLogger returns the same logger for a name, so handlers
+        # are attached only by the first BotLogger created in the process
+        self.logger = logging.getLogger(LOGGER_NAME)
+        if getattr(self.logger, '_bot_configured', False):
             return
-            
-        self._initialized = True
-        self.logger = logging.getLogger('BinanceFuturesBot')
-        self.logger.setLevel(logging.DEBUG)
+        self.logger._bot_configured = True
+        
+        # getLevelName returns a string for names it does not know
+        file_level = logging.getLevelName(Config.LOG_FILE_LEVEL)
+        unknown_level = not isinstance(file_level, int)
+        if unknown_level:
+            file_level = logging.INFO
+        self.logger.setLevel(min(file_level, logging.INFO))
         
         # Create logs directory if it doesn't exist
         log_dir = Path(__file__).parent.parent
@@ -32,7 +36,7 @@ class BotLogger:
         
         # File handler
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        file_handler.setLevel(file_level)
         file_formatter = logging.Formatter(
             Config.LOG_FORMAT,
             datefmt=Config.LOG_DATE_FORMAT
@@ -47,48 +51,76 @@ class BotLogger:
         )
         console_handler.setFormatter(console_formatter)
         
+        # File writes happen on a background listener thread so callers
+        # only pay for a queue put; console output stays synchronous to
+        # keep its ordering with the CLI's print() output
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(file_level)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        
         # Add handlers
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(queue_handler)
         self.logger.addHandler(console_handler)
+        
+        if unknown_level:
+            self.logger.warning("Unknown LOG_FILE_LEVEL %r, using INFO", Config.LOG_FILE_LEVEL)
     
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message, exc_info=False):
+    def error(self, message, *args, exc_info=False):
         """Log error message with optional exception trace"""
-        self.logger.error(message, exc_info=exc_info)
+        self.logger.error(message, *args, exc_info=exc_info)
     
-    def critical(self, message, exc_info=False):
+    def critical(self, message, *args, exc_info=False):
         """Log critical message with optional exception trace"""
-        self.logger.critical(message, exc_info=exc_info)
+        self.logger.critical(message, *args, exc_info=exc_info)
     
     def log_order(self, order_type, symbol, side, quantity, price=None, status='PENDING'):
         """Log order placement"""
-        msg = f"ORDER [{order_type}] {side} {quantity} {symbol}"
         if price:
-            msg += f" @ {price}"
-        msg += f" - Status: {status}"
-        self.info(msg)
+            self.info("ORDER [%s] %s %s %s @ %s - Status: %s",
+                      order_type, side, quantity, symbol, price, status)
+        else:
+            self.info("ORDER [%s] %s %s %s - Status: %s",
+                      order_type, side, quantity, symbol, status)
+    
+    def log_order_complete(self, order_type, symbol, side, quantity, price, order):
+        """Log a placed order and the key fields of its response as one record"""
+        self.info("ORDER [%s] %s %s %s @ %s - Status: %s | orderId: %s, "
+                  "executedQty: %s, avgPrice: %s",
+                  order_type, side, quantity, symbol, price,
+                  order.get('status'), order.get('orderId'),
+                  order.get('executedQty'), order.get('avgPrice'))
     
     def log_api_call(self, endpoint, params=None):
         """Log API call"""
-        msg = f"API CALL: {endpoint}"
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if params:
-            msg += f" | Params: {params}"
-        self.debug(msg)
+            self.debug("API CALL: %s | Params: %s", endpoint, params)
+        else:
+            self.debug("API CALL: %s", endpoint)
     
     def log_api_response(self, response_data):
         """Log API response"""
-        self.debug(f"API RESPONSE: {response_data}")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.debug("API RESPONSE: %s", response_data)
     
     def log_error_trace(self, error, context=""):
         """Log error with full trace"""
@@ -97,3 +129,15 @@ class BotLogger:
 
 # Global logger instance
 logger = BotLogger()
+
+# Module-level shortcuts, e.g. `from logger import info`
+info = logger.info
+debug = logger.debug
+warning = logger.warning
+error = logger.error
+critical = logger.critical
+log_order = logger.log_order
+log_order_complete = logger.log_order_complete
+log_api_call = logger.log_api_call
+log_api_response = logger.log_api_response
+log_error_trace = logger.log_error_trace
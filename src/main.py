@@ -1,65 +1,156 @@
 """
 Main CLI interface for Binance Futures Trading Bot
-Provides interactive menu for all order types
+Provides interactive menu for all order types, and one-shot subcommands
+(e.g. python main.py market --symbol BTCUSDT --side BUY --qty 0.01) for scripts
 """
+import argparse
+import importlib
 import sys
-import os
-from colorama import Fore, Style, init
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from requests.exceptions import RequestException
+from colors import Fore, Style
 from config import Config
 from base_bot import BasicBot
 from logger import logger
+from validator import ValidationError
+from advanced.oco import OCOError
 
-# Initialize colorama
-init(autoreset=True)
+# Errors a menu action reports and recovers from; anything else reaches the
+# main loop, which logs it with a traceback
+_ACTION_ERRORS = (
+    BinanceAPIException,
+    BinanceRequestException,
+    RequestException,
+    ValidationError,
+    ValueError,
+    OCOError,
+)
+
+# Bot class -> instance, so repeated menu actions reuse one connected bot
+_BOT_CACHE = {}
+
+# (module, class name) -> class, filled the first time an action needs it
+_BOT_CLASSES = {}
+
+def load_bot_class(module_name, class_name):
+    """Import a bot class on first use and keep it for later menu actions"""
+    key = (module_name, class_name)
+    bot_class = _BOT_CLASSES.get(key)
+    if bot_class is None:
+        module = importlib.import_module(module_name)
+        bot_class = _BOT_CLASSES[key] = getattr(module, class_name)
+    return bot_class
+
+def get_bot(bot_class):
+    """Return the shared bot of the given class, creating it on first use"""
+    bot = _BOT_CACHE.get(bot_class)
+    if bot is None:
+        bot = _BOT_CACHE[bot_class] = bot_class(testnet=True)
+    return bot
+
+# Banner and menu never change, so they are built once at import
+_BANNER = "\n".join([
+    f"\n{Fore.CYAN}{'='*70}{Style.RESET_ALL}",
+    f"{Fore.CYAN}{'':^70}{Style.RESET_ALL}",
+    f"{Fore.YELLOW}{'Binance Futures Trading Bot':^70}{Style.RESET_ALL}",
+    f"{Fore.GREEN}{'Testnet Mode':^70}{Style.RESET_ALL}",
+    f"{Fore.CYAN}{'':^70}{Style.RESET_ALL}",
+    f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}\n",
+])
+
+_MENU = "\n".join([
+    f"\n{Fore.YELLOW}Available Order Types:{Style.RESET_ALL}\n",
+    f"{Fore.GREEN}Core Orders:{Style.RESET_ALL}",
+    "  1. Market Order     - Execute at current market price",
+    "  2. Limit Order      - Place order at specific price\n",
+    
+    f"{Fore.CYAN}Advanced Orders:{Style.RESET_ALL}",
+    "  3. Stop-Limit       - Trigger limit order at stop price",
+    "  4. OCO Order        - One-Cancels-the-Other (TP + SL)",
+    "  5. TWAP Strategy    - Time-Weighted Average Price",
+    "  6. Grid Trading     - Automated buy-low/sell-high\n",
+    
+    f"{Fore.MAGENTA}Account & Info:{Style.RESET_ALL}",
+    "  7. View Balance     - Check account balance",
+    "  8. View Positions   - Check open positions",
+    "  9. View Orders      - Check open orders",
+    "  10. Dashboard       - Balance, positions and orders at once\n",
+    
+    "  0. Exit\n",
+])
 
 def print_banner():
     """Print bot banner"""
-    print(f"\n{Fore.CYAN}{'='*70}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'':^70}{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'Binance Futures Trading Bot':^70}{Style.RESET_ALL}")
-    print(f"{Fore.GREEN}{'Testnet Mode':^70}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'':^70}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'='*70}{Style.RESET_ALL}\n")
+    print(_BANNER)
 
 def print_menu():
     """Print main menu"""
-    print(f"\n{Fore.YELLOW}Available Order Types:{Style.RESET_ALL}\n")
-    print(f"{Fore.GREEN}Core Orders:{Style.RESET_ALL}")
-    print(f"  1. Market Order     - Execute at current market price")
-    print(f"  2. Limit Order      - Place order at specific price\n")
-    
-    print(f"{Fore.CYAN}Advanced Orders:{Style.RESET_ALL}")
-    print(f"  3. Stop-Limit       - Trigger limit order at stop price")
-    print(f"  4. OCO Order        - One-Cancels-the-Other (TP + SL)")
-    print(f"  5. TWAP Strategy    - Time-Weighted Average Price")
-    print(f"  6. Grid Trading     - Automated buy-low/sell-high\n")
-    
-    print(f"{Fore.MAGENTA}Account & Info:{Style.RESET_ALL}")
-    print(f"  7. View Balance     - Check account balance")
-    print(f"  8. View Positions   - Check open positions")
-    print(f"  9. View Orders      - Check open orders\n")
+    print(_MENU)
+
+def run_action(action, *args):
+    """
+    Run an order or account action, reporting the errors it is expected to raise
     
-    print(f"  0. Exit\n")
+    Returns:
+        True if the action completed, False if it failed
+    """
+    try:
+        action(*args)
+        return True
+    except _ACTION_ERRORS as e:
+        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        return False
+
+# Each action converts its numeric arguments before get_bot, so bad input
+# fails before the bot connects
+def market_order(symbol, side, quantity):
+    """Place a market order"""
+    quantity = float(quantity)
+    bot = get_bot(load_bot_class('market_orders', 'MarketOrderBot'))
+    bot.place_market_order(symbol, side, quantity)
+
+def limit_order(symbol, side, quantity, price, tif):
+    """Place a limit order"""
+    quantity, price = float(quantity), float(price)
+    bot = get_bot(load_bot_class('limit_orders', 'LimitOrderBot'))
+    bot.place_limit_order(symbol, side, quantity, price, tif)
+
+def stop_limit_order(symbol, side, quantity, stop_price, limit_price):
+    """Place a stop-limit order"""
+    quantity, stop_price, limit_price = float(quantity), float(stop_price), float(limit_price)
+    bot = get_bot(load_bot_class('advanced.stop_limit', 'StopLimitBot'))
+    bot.place_stop_limit_order(symbol, side, quantity, stop_price, limit_price)
+
+def oco_order(symbol, side, quantity, tp_price, sl_price):
+    """Place an OCO order"""
+    quantity, tp_price, sl_price = float(quantity), float(tp_price), float(sl_price)
+    bot = get_bot(load_bot_class('advanced.oco', 'OCOBot'))
+    bot.place_oco_order(symbol, side, quantity, tp_price, sl_price)
+
+def twap_order(symbol, side, total_qty, num_orders, interval):
+    """Execute a TWAP strategy"""
+    total_qty, num_orders, interval = float(total_qty), int(num_orders), int(interval)
+    bot = get_bot(load_bot_class('advanced.twap', 'TWAPBot'))
+    bot.execute_twap_order(symbol, side, total_qty, num_orders, interval)
+
+def grid_orders(symbol, lower, upper, num_grids, qty_per_grid):
+    """Set up grid trading orders"""
+    lower, upper = float(lower), float(upper)
+    num_grids, qty_per_grid = int(num_grids), float(qty_per_grid)
+    bot = get_bot(load_bot_class('advanced.grid_strategy', 'GridBot'))
+    bot.setup_grid_orders(symbol, lower, upper, num_grids, qty_per_grid)
 
 def run_market_order():
     """Run market order"""
-    from market_orders import MarketOrderBot
-    
     print(f"\n{Fore.YELLOW}=== Market Order ==={Style.RESET_ALL}\n")
     symbol = input("Symbol (e.g., BTCUSDT): ").strip()
     side = input("Side (BUY/SELL): ").strip()
     quantity = input("Quantity: ").strip()
     
-    try:
-        bot = MarketOrderBot(testnet=True)
-        bot.place_market_order(symbol, side, float(quantity))
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(market_order, symbol, side, quantity)
 
 def run_limit_order():
     """Run limit order"""
-    from limit_orders import LimitOrderBot
-    
     print(f"\n{Fore.YELLOW}=== Limit Order ==={Style.RESET_ALL}\n")
     symbol = input("Symbol (e.g., BTCUSDT): ").strip()
     side = input("Side (BUY/SELL): ").strip()
@@ -67,17 +158,10 @@ def run_limit_order():
     price = input("Limit Price: ").strip()
     tif = input("Time in Force (GTC/IOC/FOK) [GTC]: ").strip() or "GTC"
     
-    try:
-        bot = LimitOrderBot(testnet=True)
-        bot.place_limit_order(symbol, side, float(quantity), float(price), tif)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(limit_order, symbol, side, quantity, price, tif)
 
 def run_stop_limit():
     """Run stop-limit order"""
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'advanced'))
-    from advanced.stop_limit import StopLimitBot
-    
     print(f"\n{Fore.YELLOW}=== Stop-Limit Order ==={Style.RESET_ALL}\n")
     symbol = input("Symbol (e.g., BTCUSDT): ").strip()
     side = input("Side (BUY/SELL): ").strip()
@@ -85,18 +169,10 @@ def run_stop_limit():
     stop_price = input("Stop Price: ").strip()
     limit_price = input("Limit Price: ").strip()
     
-    try:
-        bot = StopLimitBot(testnet=True)
-        bot.place_stop_limit_order(symbol, side, float(quantity), 
-                                   float(stop_price), float(limit_price))
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(stop_limit_order, symbol, side, quantity, stop_price, limit_price)
 
 def run_oco():
     """Run OCO order"""
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'advanced'))
-    from advanced.oco import OCOBot
-    
     print(f"\n{Fore.YELLOW}=== OCO Order ==={Style.RESET_ALL}\n")
     symbol = input("Symbol (e.g., BTCUSDT): ").strip()
     side = input("Side (BUY/SELL): ").strip()
@@ -104,18 +180,10 @@ def run_oco():
     tp_price = input("Take Profit Price: ").strip()
     sl_price = input("Stop Loss Price: ").strip()
     
-    try:
-        bot = OCOBot(testnet=True)
-        bot.place_oco_order(symbol, side, float(quantity), 
-                           float(tp_price), float(sl_price))
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(oco_order, symbol, side, quantity, tp_price, sl_price)
 
 def run_twap():
     """Run TWAP strategy"""
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'advanced'))
-    from advanced.twap import TWAPBot
-    
     print(f"\n{Fore.YELLOW}=== TWAP Strategy ==={Style.RESET_ALL}\n")
     symbol = input("Symbol (e.g., BTCUSDT): ").strip()
     side = input("Side (BUY/SELL): ").strip()
@@ -123,18 +191,10 @@ def run_twap():
     num_orders = input("Number of Orders: ").strip()
     interval = input("Interval (seconds): ").strip()
     
-    try:
-        bot = TWAPBot(testnet=True)
-        bot.execute_twap_order(symbol, side, float(total_qty), 
-                              int(num_orders), int(interval))
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(twap_order, symbol, side, total_qty, num_orders, interval)
 
 def run_grid():
     """Run grid trading"""
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'advanced'))
-    from advanced.grid_strategy import GridBot
-    
     print(f"\n{Fore.YELLOW}=== Grid Trading ==={Style.RESET_ALL}\n")
     symbol = input("Symbol (e.g., BTCUSDT): ").strip()
     lower = input("Lower Price: ").strip()
@@ -142,69 +202,155 @@ def run_grid():
     num_grids = input("Number of Grids: ").strip()
     qty_per_grid = input("Quantity per Grid: ").strip()
     
-    try:
-        bot = GridBot(testnet=True)
-        bot.setup_grid_orders(symbol, float(lower), float(upper), 
-                             int(num_grids), float(qty_per_grid))
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(grid_orders, symbol, lower, upper, num_grids, qty_per_grid)
+
+# One entry of the positions/orders listings; each is followed by a blank line
+_POSITION_ROW = (
+    "Symbol: {symbol}\n"
+    "  Position: {positionAmt}\n"
+    "  Entry Price: {entryPrice}\n"
+    "  Unrealized PnL: {unRealizedProfit}\n"
+)
+_ORDER_ROW = (
+    "Order ID: {orderId}\n"
+    "  Symbol: {symbol}\n"
+    "  Side: {side}\n"
+    "  Type: {type}\n"
+    "  Price: {price}\n"
+    "  Quantity: {origQty}\n"
+)
+
+def print_balance(balance):
+    """Print account balance"""
+    print(f"\n{Fore.GREEN}=== Account Balance ==={Style.RESET_ALL}\n")
+    print(f"Total Balance:      {balance['total_balance']} USDT")
+    print(f"Available Balance:  {balance['available_balance']} USDT")
+    print(f"Unrealized PnL:     {balance['total_unrealized_profit']} USDT")
+
+def print_positions(positions):
+    """Print open positions"""
+    print(f"\n{Fore.GREEN}=== Open Positions ==={Style.RESET_ALL}\n")
+    if not positions:
+        print("No open positions")
+    else:
+        # Format every entry first and write the listing in one call
+        print("\n".join([
+            _POSITION_ROW.format_map(pos) for pos in positions
+        ]))
+
+def print_orders(orders):
+    """Print open orders"""
+    print(f"\n{Fore.GREEN}=== Open Orders ==={Style.RESET_ALL}\n")
+    if not orders:
+        print("No open orders")
+    else:
+        print("\n".join([
+            _ORDER_ROW.format_map({**order, 'price': order.get('price', 'N/A')})
+            for order in orders
+        ]))
+
+def show_balance():
+    """Fetch and print account balance"""
+    print_balance(get_bot(BasicBot).get_account_balance())
+
+def show_positions():
+    """Fetch and print open positions"""
+    print_positions(get_bot(BasicBot).get_position_info())
+
+def show_orders():
+    """Fetch and print open orders"""
+    print_orders(get_bot(BasicBot).get_open_orders())
+
+def show_dashboard():
+    """Fetch and print balance, positions and open orders together"""
+    bot = get_bot(BasicBot)
+    
+    # The three requests are independent, so fetch them in one round-trip
+    executor = bot.get_executor()
+    positions_future = executor.submit(bot.get_position_info)
+    orders_future = executor.submit(bot.get_open_orders)
+    balance = bot.get_account_balance()
+    
+    print_balance(balance)
+    print_positions(positions_future.result())
+    print_orders(orders_future.result())
 
 def view_balance():
     """View account balance"""
-    try:
-        bot = BasicBot(testnet=True)
-        balance = bot.get_account_balance()
-        
-        print(f"\n{Fore.GREEN}=== Account Balance ==={Style.RESET_ALL}\n")
-        print(f"Total Balance:      {balance['total_balance']} USDT")
-        print(f"Available Balance:  {balance['available_balance']} USDT")
-        print(f"Unrealized PnL:     {balance['total_unrealized_profit']} USDT")
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(show_balance)
 
 def view_positions():
     """View open positions"""
-    try:
-        bot = BasicBot(testnet=True)
-        positions = bot.get_position_info()
-        
-        print(f"\n{Fore.GREEN}=== Open Positions ==={Style.RESET_ALL}\n")
-        if not positions:
-            print("No open positions")
-        else:
-            for pos in positions:
-                print(f"Symbol: {pos['symbol']}")
-                print(f"  Position: {pos['positionAmt']}")
-                print(f"  Entry Price: {pos['entryPrice']}")
-                print(f"  Unrealized PnL: {pos['unRealizedProfit']}")
-                print()
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(show_positions)
 
 def view_orders():
     """View open orders"""
-    try:
-        bot = BasicBot(testnet=True)
-        orders = bot.get_open_orders()
-        
-        print(f"\n{Fore.GREEN}=== Open Orders ==={Style.RESET_ALL}\n")
-        if not orders:
-            print("No open orders")
-        else:
-            for order in orders:
-                print(f"Order ID: {order['orderId']}")
-                print(f"  Symbol: {order['symbol']}")
-                print(f"  Side: {order['side']}")
-                print(f"  Type: {order['type']}")
-                print(f"  Price: {order.get('price', 'N/A')}")
-                print(f"  Quantity: {order['origQty']}")
-                print()
-    except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+    run_action(show_orders)
+
+def view_dashboard():
+    """View balance, positions and open orders together"""
+    run_action(show_dashboard)
 
-def main():
-    """Main CLI loop"""
-    print_banner()
+# Numeric subcommand options, parsed by argparse so a typo is reported
+# before the bot connects
+_OPTION_TYPES = {
+    'qty': float,
+    'price': float,
+    'stop-price': float,
+    'limit-price': float,
+    'tp-price': float,
+    'sl-price': float,
+    'lower': float,
+    'upper': float,
+    'orders': int,
+    'interval': int,
+    'grids': int,
+}
+
+def build_parser():
+    """Build the parser for one-shot subcommands (no subcommand = interactive menu)"""
+    parser = argparse.ArgumentParser(
+        description="Binance Futures Trading Bot. Run without a command for the interactive menu."
+    )
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    
+    def add_command(name, action, help_text, *required, **optional):
+        """Add a subcommand whose --options map, in order, onto the action's arguments"""
+        command = commands.add_parser(name, help=help_text)
+        for option in required:
+            command.add_argument(f"--{option}", required=True,
+                                 type=_OPTION_TYPES.get(option, str))
+        for option, default in optional.items():
+            command.add_argument(f"--{option}", default=default,
+                                 help=f"(default: {default})")
+        params = [option.replace('-', '_') for option in required] + list(optional)
+        command.set_defaults(action=action, params=params)
+    
+    add_command('market', market_order, "Place a market order",
+                'symbol', 'side', 'qty')
+    add_command('limit', limit_order, "Place a limit order",
+                'symbol', 'side', 'qty', 'price', tif='GTC')
+    add_command('stop-limit', stop_limit_order, "Place a stop-limit order",
+                'symbol', 'side', 'qty', 'stop-price', 'limit-price')
+    add_command('oco', oco_order, "Place an OCO order",
+                'symbol', 'side', 'qty', 'tp-price', 'sl-price')
+    add_command('twap', twap_order, "Execute a TWAP strategy",
+                'symbol', 'side', 'qty', 'orders', 'interval')
+    add_command('grid', grid_orders, "Set up grid trading orders",
+                'symbol', 'lower', 'upper', 'grids', 'qty')
+    add_command('balance', show_balance, "Show account balance")
+    add_command('positions', show_positions, "Show open positions")
+    add_command('orders', show_orders, "Show open orders")
+    add_command('dashboard', show_dashboard, "Show balance, positions and open orders")
+    
+    return parser
+
+def main(argv=None):
+    """CLI entry point: run one subcommand, or the interactive menu without one"""
+    args = build_parser().parse_args(argv)
+    
+    if args.command is None:
+        print_banner()
     
     # Check configuration
     try:
@@ -215,6 +361,10 @@ def main():
         print(f"See .env.example for reference.")
         sys.exit(1)
     
+    if args.command is not None:
+        params = [getattr(args, name) for name in args.params]
+        sys.exit(0 if run_action(args.action, *params) else 1)
+    
     menu_actions = {
         '1': run_market_order,
         '2': run_limit_order,
@@ -225,12 +375,13 @@ def main():
         '7': view_balance,
         '8': view_positions,
         '9': view_orders,
+        '10': view_dashboard,
     }
     
     while True:
         try:
             print_menu()
-            choice = input(f"{Fore.CYAN}Select option (0-9): {Style.RESET_ALL}").strip()
+            choice = input(f"{Fore.CYAN}Select option (0-10): {Style.RESET_ALL}").strip()
             
             if choice == '0':
                 print(f"\n{Fore.YELLOW}Exiting... Goodbye!{Style.RESET_ALL}\n")
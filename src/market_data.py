@@ -0,0 +1,102 @@
+"""
+Market data module for Binance Futures Trading Bot
+Keeps live prices in memory from Binance WebSocket streams
+"""
+import threading
+import time
+from binance import ThreadedWebsocketManager
+from config import Config
+from logger import logger
+
+class BinanceTickerStream:
+    """Live futures prices from the all-market mini ticker stream"""
+    
+    STREAM = '!miniTicker@arr'
+    
+    def __init__(self, testnet=True):
+        """
+        Initialize the ticker stream
+        
+        Args:
+            testnet: Use testnet stream endpoint (default: True)
+        """
+        self.testnet = testnet
+        # symbol -> (monotonic timestamp, last price)
+        self.prices = {}
+        self._manager = None
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """
+        Start the background WebSocket connection
+        
+        Returns:
+            True if the stream is running, False if it could not connect
+            (prices then keep coming from REST)
+        """
+        with self._lock:
+            if self._manager is not None:
+                return True
+            
+            manager = ThreadedWebsocketManager(testnet=self.testnet)
+            # Never keep the process alive just for price updates
+            manager.daemon = True
+            manager.start()
+            
+            # Subscribing blocks until the manager's async client is up,
+            # which never happens if that client fails to connect
+            deadline = time.monotonic() + Config.STREAM_CONNECT_TIMEOUT
+            while getattr(manager, '_bsm', None) is None:
+                if not manager.is_alive() or time.monotonic() > deadline:
+                    manager.stop()
+                    logger.warning("Ticker stream could not connect; using REST prices")
+                    return False
+                time.sleep(0.1)
+            
+            self._manager = manager
+            self._manager.start_futures_multiplex_socket(
+                callback=self._handle_message,
+                streams=[self.STREAM]
+            )
+            logger.info(f"Ticker stream started: {self.STREAM}")
+            return True
+    
+    def stop(self):
+        """Stop the background WebSocket connection"""
+        with self._lock:
+            if self._manager is None:
+                return
+            
+            self._manager.stop()
+            self._manager = None
+            logger.info("Ticker stream stopped")
+    
+    def _handle_message(self, msg):
+        """Store prices from a combined-stream mini ticker message"""
+        data = msg.get('data') if isinstance(msg, dict) else None
+        if not isinstance(data, list):
+            logger.warning(f"Unexpected ticker stream message: {msg}")
+            return
+        
+        now = time.monotonic()
+        for ticker in data:
+            self.prices[ticker['s']] = (now, float(ticker['c']))
+    
+    def get_price(self, symbol, max_age=None):
+        """
+        Get the last streamed price for a symbol
+        
+        Args:
+            symbol: Trading pair symbol
+            max_age: Maximum age in seconds (default: Config.STREAM_PRICE_MAX_AGE)
+            
+        Returns:
+            Price as float, or None if missing or stale
+        """
+        if max_age is None:
+            max_age = Config.STREAM_PRICE_MAX_AGE
+        
+        entry = self.prices.get(symbol)
+        if entry and time.monotonic() - entry[0] < max_age:
+            return entry[1]
+        return None
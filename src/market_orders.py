@@ -7,15 +7,12 @@ from binance.exceptions import BinanceAPIException
 from base_bot import BasicBot
 from logger import logger
 from validator import Validator, ValidationError
-from colorama import Fore, Style, init
-
-# Initialize colorama
-init(autoreset=True)
+from colors import Fore, Style, RULE
 
 class MarketOrderBot(BasicBot):
     """Bot for executing market orders"""
     
-    def place_market_order(self, symbol, side, quantity):
+    def place_market_order(self, symbol, side, quantity, current_price=None):
         """
         Place a market order
         
@@ -23,6 +20,7 @@ class MarketOrderBot(BasicBot):
             symbol: Trading pair (e.g., BTCUSDT)
             side: BUY or SELL
             quantity: Order quantity
+            current_price: Reference market price (optional, looked up if not provided)
             
         Returns:
             Order response dict
@@ -33,14 +31,8 @@ class MarketOrderBot(BasicBot):
             side = Validator.validate_side(side)
             quantity = Validator.validate_quantity(quantity)
             
-            # Log order attempt
-            logger.log_order('MARKET', symbol, side, quantity)
-            
-            # Get current price for reference
-            current_price = self.get_current_price(symbol)
-            logger.info(f"Current market price: {current_price}")
-            
-            # Place market order
+            # Place market order; the attempt is only logged at DEBUG, the
+            # outcome is logged once below
             logger.log_api_call("newOrder", {
                 "symbol": symbol,
                 "side": side,
@@ -48,28 +40,28 @@ class MarketOrderBot(BasicBot):
                 "quantity": quantity
             })
             
-            order = self.client.futures_create_order(
-                symbol=symbol,
+            order, current_price = self._place_with_reference_price(
+                symbol,
+                current_price,
                 side=side,
                 type='MARKET',
                 quantity=quantity
             )
             
-            # Log successful order
-            logger.log_order('MARKET', symbol, side, quantity, 
-                           current_price, 'FILLED')
-            logger.log_api_response(order)
+            logger.log_order_complete('MARKET', symbol, side, quantity,
+                                      current_price, order)
             
             # Print success message
-            print(f"\n{Fore.GREEN}✓ Market Order Executed Successfully!{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Order ID:{Style.RESET_ALL} {order['orderId']}")
-            print(f"{Fore.CYAN}Symbol:{Style.RESET_ALL} {order['symbol']}")
-            print(f"{Fore.CYAN}Side:{Style.RESET_ALL} {order['side']}")
-            print(f"{Fore.CYAN}Quantity:{Style.RESET_ALL} {order['origQty']}")
-            print(f"{Fore.CYAN}Status:{Style.RESET_ALL} {order['status']}")
-            
-            if 'avgPrice' in order and order['avgPrice']:
-                print(f"{Fore.CYAN}Average Price:{Style.RESET_ALL} {order['avgPrice']}")
+            if self.verbose:
+                print(f"\n{Fore.GREEN}✓ Market Order Executed Successfully!{Style.RESET_ALL}")
+                print(f"{Fore.CYAN}Order ID:{Style.RESET_ALL} {order['orderId']}")
+                print(f"{Fore.CYAN}Symbol:{Style.RESET_ALL} {order['symbol']}")
+                print(f"{Fore.CYAN}Side:{Style.RESET_ALL} {order['side']}")
+                print(f"{Fore.CYAN}Quantity:{Style.RESET_ALL} {order['origQty']}")
+                print(f"{Fore.CYAN}Status:{Style.RESET_ALL} {order['status']}")
+                
+                if 'avgPrice' in order and order['avgPrice']:
+                    print(f"{Fore.CYAN}Average Price:{Style.RESET_ALL} {order['avgPrice']}")
             
             return order
             
@@ -90,9 +82,9 @@ class MarketOrderBot(BasicBot):
 
 def main():
     """CLI entry point for market orders"""
-    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}{RULE}{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Binance Futures - Market Order Bot{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+    print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
     
     # Check command line arguments
     if len(sys.argv) < 4:
@@ -125,7 +117,7 @@ def main():
         order = bot.place_market_order(symbol, side, float(quantity))
         
         print(f"\n{Fore.GREEN}Order placed successfully!{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+        print(f"{Fore.YELLOW}{RULE}{Style.RESET_ALL}\n")
         
     except KeyboardInterrupt:
         print(f"\n\n{Fore.YELLOW}Operation cancelled by user{Style.RESET_ALL}")
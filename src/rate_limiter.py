@@ -0,0 +1,102 @@
+"""
+Rate limiting module for Binance Futures Trading Bot
+Client-side token buckets that keep order bursts under Binance's limits
+"""
+import functools
+import threading
+import time
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously over a fixed period"""
+    
+    def __init__(self, capacity, period):
+        """
+        Initialize the bucket
+        
+        Args:
+            capacity: Maximum tokens available per period
+            period: Refill period in seconds
+        """
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Add tokens accrued since the last update"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self, tokens=1):
+        """Block until the requested tokens are available, then take them"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def set_used(self, used):
+        """Clamp available tokens to what the server reports as unused"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, max(0.0, self.capacity - used))
+
+class RateLimiter:
+    """Request-weight and order-count limits for one Binance account"""
+    
+    def __init__(self, weight_limit, order_limit):
+        """
+        Initialize the limiter
+        
+        Args:
+            weight_limit: Request weight allowed per minute
+            order_limit: Orders allowed per 10 seconds
+        """
+        self.weight = TokenBucket(weight_limit, 60)
+        self.orders = TokenBucket(order_limit, 10)
+        self._pause_until = 0.0
+    
+    def acquire(self, weight=1, orders=1):
+        """Block until a call of the given weight and order count may proceed"""
+        delay = self._pause_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.weight.acquire(weight)
+        if orders:
+            self.orders.acquire(orders)
+    
+    def update_from_response(self, response, *args, **kwargs):
+        """
+        Sync the buckets with the usage headers on a response
+        
+        Installed as a requests response hook, so it sees every REST call
+        made through the session, not only order placement.
+        """
+        used_weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight:
+            self.weight.set_used(int(used_weight))
+        
+        order_count = response.headers.get('X-MBX-ORDER-COUNT-10S')
+        if order_count:
+            self.orders.set_used(int(order_count))
+        
+        # 429 warns before a ban, 418 means banned; both carry Retry-After
+        if response.status_code in (418, 429):
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                self._pause_until = max(self._pause_until, time.monotonic() + int(retry_after))
+
+def rate_limited(limiter, weight=1, orders=1):
+    """Decorator that acquires from the limiter before each call"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            limiter.acquire(weight, orders)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
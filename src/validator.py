@@ -2,7 +2,7 @@
 Input validation module for trading bot
 Validates symbols, quantities, prices, and other trading parameters
 """
-import re
+import functools
 from typing import Optional
 from config import Config
 
@@ -13,16 +13,17 @@ class ValidationError(Exception):
 class Validator:
     """Validator class for trading parameters"""
     
-    # Valid trading symbols pattern (e.g., BTCUSDT, ETHUSDT)
-    SYMBOL_PATTERN = re.compile(r'^[A-Z]{2,10}USDT$')
-    
     # Valid order sides
-    VALID_SIDES = ['BUY', 'SELL']
+    VALID_SIDES = frozenset({'BUY', 'SELL'})
     
     # Valid order types
-    VALID_ORDER_TYPES = ['MARKET', 'LIMIT', 'STOP_MARKET', 'STOP_LIMIT', 'TAKE_PROFIT_MARKET']
+    VALID_ORDER_TYPES = frozenset({'MARKET', 'LIMIT', 'STOP_MARKET', 'STOP_LIMIT', 'TAKE_PROFIT_MARKET'})
+    
+    # Valid time in force values
+    VALID_TIME_IN_FORCE = frozenset({'GTC', 'IOC', 'FOK'})
     
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def validate_symbol(symbol: str) -> str:
         """
         Validate trading symbol
@@ -41,7 +42,11 @@ class Validator:
         
         symbol = symbol.upper().strip()
         
-        if not Validator.SYMBOL_PATTERN.match(symbol):
+        # Valid trading symbols: 2-10 uppercase ASCII letters followed by
+        # USDT (e.g., BTCUSDT, ETHUSDT)
+        base = symbol[:-4]
+        if not (symbol.endswith('USDT') and 2 <= len(base) <= 10
+                and base.isascii() and base.isalpha() and base.isupper()):
             raise ValidationError(
                 f"Invalid symbol format: {symbol}. "
                 "Expected format: BTCUSDT, ETHUSDT, etc."
@@ -50,6 +55,7 @@ class Validator:
         return symbol
     
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def validate_side(side: str) -> str:
         """
         Validate order side
@@ -66,7 +72,7 @@ class Validator:
         if not side:
             raise ValidationError("Side cannot be empty")
         
-        side = side.upper().strip()
+        side = side.strip().upper()
         
         if side not in Validator.VALID_SIDES:
             raise ValidationError(
@@ -90,12 +96,15 @@ class Validator:
         Raises:
             ValidationError: If quantity is invalid
         """
-        try:
-            quantity = float(quantity)
-        except (ValueError, TypeError):
-            raise ValidationError(f"Invalid quantity: {quantity}. Must be a number")
-        
-        if quantity <= 0:
+        # Callers usually pass floats already; only parse anything else
+        if type(quantity) is not float:
+            try:
+                quantity = float(quantity)
+            except (ValueError, TypeError):
+                raise ValidationError(f"Invalid quantity: {quantity}. Must be a number")
+        
+        # Written so that NaN fails too
+        if not quantity > 0:
             raise ValidationError(f"Quantity must be positive: {quantity}")
         
         min_check = min_qty if min_qty is not None else Config.MIN_QUANTITY
@@ -125,17 +134,20 @@ class Validator:
         Raises:
             ValidationError: If price is invalid
         """
-        try:
-            price = float(price)
-        except (ValueError, TypeError):
-            raise ValidationError(f"Invalid price: {price}. Must be a number")
-        
-        if price <= 0:
+        if type(price) is not float:
+            try:
+                price = float(price)
+            except (ValueError, TypeError):
+                raise ValidationError(f"Invalid price: {price}. Must be a number")
+        
+        # Written so that NaN fails too
+        if not price > 0:
             raise ValidationError(f"Price must be positive: {price}")
         
         return price
     
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def validate_order_type(order_type: str) -> str:
         """
         Validate order type
@@ -152,17 +164,18 @@ class Validator:
         if not order_type:
             raise ValidationError("Order type cannot be empty")
         
-        order_type = order_type.upper().strip()
+        order_type = order_type.strip().upper()
         
         if order_type not in Validator.VALID_ORDER_TYPES:
             raise ValidationError(
                 f"Invalid order type: {order_type}. "
-                f"Valid types: {', '.join(Validator.VALID_ORDER_TYPES)}"
+                f"Valid types: {', '.join(sorted(Validator.VALID_ORDER_TYPES))}"
             )
         
         return order_type
     
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def validate_leverage(leverage: int) -> int:
         """
         Validate leverage value
@@ -189,6 +202,7 @@ class Validator:
         return leverage
     
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def validate_time_in_force(time_in_force: str) -> str:
         """
         Validate time in force parameter
@@ -202,13 +216,12 @@ class Validator:
         Raises:
             ValidationError: If time in force is invalid
         """
-        valid_tif = ['GTC', 'IOC', 'FOK']
-        time_in_force = time_in_force.upper().strip()
+        time_in_force = time_in_force.strip().upper()
         
-        if time_in_force not in valid_tif:
+        if time_in_force not in Validator.VALID_TIME_IN_FORCE:
             raise ValidationError(
                 f"Invalid time in force: {time_in_force}. "
-                f"Valid values: {', '.join(valid_tif)}"
+                f"Valid values: {', '.join(sorted(Validator.VALID_TIME_IN_FORCE))}"
             )
         
         return time_in_force